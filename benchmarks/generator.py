@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+import random
+
+# Vocabulary Sizes Close to BGG's (Families and People Grow With the Collection)
+N_CATEGORIES = 84
+N_MECHANICS = 182
+MIN_FAMILIES = 50
+MIN_PEOPLE = 40
+
+PLAY_TIMES = [10, 15, 20, 30, 45, 60, 75, 90, 120, 150, 180, 240, 360]
+RANK_SUBTYPES = ['strategygames', 'familygames', 'thematic', 'partygames', 'abstracts', 'wargames']
+KICKSTARTER_FAMILY = 'Crowdfunding: Kickstarter'
+KICKSTARTER_RATE = 0.15
+
+
+def getVocabulary(prefix, size):
+    return ['{} {}'.format(prefix, i + 1) for i in range(size)]
+
+
+# Zipf-Like Weights, a Few Entries Are Very Common and the Rest Form a Long Tail
+def getZipfWeights(size, exponent=1.1):
+    return [1 / (i + 1) ** exponent for i in range(size)]
+
+
+def sampleEntries(rnd, vocabulary, cumWeights, k):
+    indexes = []
+    for index in rnd.choices(range(len(vocabulary)), cum_weights=cumWeights, k=k):
+        if index not in indexes:
+            indexes.append(index)
+    return [{'id': i + 1, 'value': vocabulary[i]} for i in indexes]
+
+
+def getCumWeights(size):
+    cumWeights = []
+    total = 0
+    for weight in getZipfWeights(size):
+        total += weight
+        cumWeights.append(total)
+    return cumWeights
+
+
+def genPlays(rnd, numPlays, lastPlay):
+    plays = []
+    remaining = numPlays
+    while remaining > 0:
+        quantity = min(remaining, rnd.choice([1, 1, 1, 2, 3]))
+        date = lastPlay - timedelta(days=rnd.randint(0, 3650))
+        plays.append({'date': date.strftime('%Y-%m-%d'), 'quantity': quantity})
+        remaining -= quantity
+    return plays
+
+
+def genItem(rnd, i, vocabularies, lastPlay):
+    numPlays = 0 if rnd.random() < 0.4 else int(rnd.expovariate(1 / 6)) + 1
+    averageRating = round(min(9.5, max(3, rnd.gauss(6.8, 0.8))), 5)
+    userRating = None if rnd.random() < 0.3 else min(10, max(1, round(rnd.gauss(averageRating, 1.2) * 2) / 2))
+    minPlayers = rnd.choice([1, 1, 2, 2, 2, 3])
+    maxPlayers = minPlayers + rnd.choice([0, 1, 2, 2, 3, 4, 6])
+    medianPrice = None if rnd.random() < 0.25 else round(rnd.lognormvariate(3.4, 0.6), 2)
+
+    rank = None if rnd.random() < 0.05 else int(rnd.lognormvariate(7, 1.5)) + 1
+    subtypeRatings = [{'name': 'boardgame', 'value': rank}]
+    if rnd.random() < 0.7:
+        subtypeRatings.append({'name': rnd.choice(RANK_SUBTYPES), 'value': rnd.randint(1, 3000)})
+
+    item = {
+        'id': 100000 + i,
+        'name': 'Boardgame {}'.format(i),
+        'image': 'https://cf.geekdo-images.com/original/img/{}.jpg'.format(i),
+        'numPlays': numPlays,
+        'playTime': rnd.choice(PLAY_TIMES),
+        'userRating': userRating,
+        'averageRating': averageRating,
+        'bayesAverageRating': round(5.5 + (averageRating - 5.5) * rnd.uniform(0.3, 0.95), 5),
+        'averageWeight': None if rnd.random() < 0.03 else round(rnd.uniform(1, 4.8), 4),
+        'medianPrice': medianPrice,
+        'averagePriceNew': None if medianPrice is None else round(medianPrice * rnd.uniform(0.8, 1.6), 2),
+        'yearPublished': min(2024, 2025 - int(rnd.expovariate(1 / 12))),
+        'minPlayers': minPlayers,
+        'maxPlayers': maxPlayers,
+        'recommendedPlayers': rnd.randint(minPlayers, maxPlayers),
+        'subtypeRatings': subtypeRatings,
+        'plays': genPlays(rnd, numPlays, lastPlay)
+    }
+    for stat, (vocabulary, cumWeights, maxEntries) in vocabularies.items():
+        item[stat] = sampleEntries(rnd, vocabulary, cumWeights, rnd.randint(0, maxEntries))
+    if rnd.random() < KICKSTARTER_RATE:
+        item['families'].append({'id': 0, 'value': KICKSTARTER_FAMILY})
+    return item
+
+
+# Same Seed and Size Give the Same Collection (Only lastLoggedPlay Follows the Current Date)
+def genCollection(nItems, seed=0):
+    rnd = random.Random('{}-{}'.format(seed, nItems))
+    nFamilies = max(MIN_FAMILIES, nItems // 4)
+    nPeople = max(MIN_PEOPLE, nItems // 3)
+    vocabularies = {}
+    for stat, prefix, size, maxEntries in [('categories', 'Category', N_CATEGORIES, 4),
+                                           ('mechanics', 'Mechanic', N_MECHANICS, 6),
+                                           ('families', 'Family', nFamilies, 4),
+                                           ('designers', 'Designer', nPeople, 2),
+                                           ('publishers', 'Publisher', nPeople, 3),
+                                           ('artists', 'Artist', nPeople, 3)]:
+        vocabularies[stat] = (getVocabulary(prefix, size), getCumWeights(size), maxEntries)
+
+    lastPlay = datetime.now() - timedelta(days=2)
+    items = [genItem(rnd, i, vocabularies, lastPlay) for i in range(nItems)]
+
+    # Several Checks Only Look at the First Item, Keep It Played and Rated so Every Insight Runs
+    if items != []:
+        first = items[0]
+        first['numPlays'] = max(first['numPlays'], 1)
+        first['plays'] = genPlays(rnd, first['numPlays'], lastPlay)
+        if first['userRating'] is None:
+            first['userRating'] = round(first['averageRating'] * 2) / 2
+    return {
+        'totalItems': nItems,
+        'totalPlays': sum(x['numPlays'] for x in items),
+        'lastLoggedPlay': lastPlay.strftime('%Y-%m-%dT00:00:00.000Z'),
+        'items': items
+    }
@@ -0,0 +1,223 @@
+from fnmatch import fnmatch
+from statistics import median
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+from src.classes.collection import Collection, INSIGHT_TYPES
+from src.ingest import STREAM_CHUNK_SIZE
+from src.utils import fitCache, getBestCurveFit, getCurveFit
+from .generator import genCollection
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.2
+
+# Sizes Below This Are Dominated by Call Overhead and Left Out of the Scaling Fit
+MIN_SCALING_SIZE = 100
+
+
+def timeCall(fn, setup=None, repeat=DEFAULT_REPEAT):
+    times = []
+    gcEnabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            gc.disable()
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+            if gcEnabled:
+                gc.enable()
+    finally:
+        if gcEnabled:
+            gc.enable()
+    return {'min': min(times), 'median': median(times)}
+
+
+# Every Run Starts Cold: Fresh Indexes (No Taxonomy Lookups or Column Aggregates), No Memoized
+# Intermediates, Cached Insights or Cached Fits
+def resetCollection(collection):
+    collection.invalidate()
+    fitCache.clear()
+
+
+def getChunks(body):
+    return [body[i:i + STREAM_CHUNK_SIZE] for i in range(0, len(body), STREAM_CHUNK_SIZE)]
+
+
+def getFitArrays(collection):
+    weights = collection.getColumn('averageWeight')
+    ratings = collection.getColumn('averageRating')
+    mask = weights.mask & ratings.mask
+    return weights.values[mask].tolist(), ratings.values[mask].tolist()
+
+
+def getBenchmarks(payload):
+    body = json.dumps(payload).encode()
+    collection = Collection(payload)
+    x, y = getFitArrays(collection)
+    insights = collection.genAllInsights(executor='serial')
+
+    benchmarks = [
+        ('collection.init', lambda: Collection(payload), None),
+        ('collection.fromStream', lambda: Collection.fromStream(getChunks(body)), None),
+        ('genAllInsights', lambda: collection.genAllInsights(executor='serial'), lambda: resetCollection(collection)),
+        ('getCurveFit', lambda: getCurveFit(x, y), fitCache.clear),
+        ('getBestCurveFit', lambda: getBestCurveFit(x, y), fitCache.clear),
+        ('json.insights', lambda: json.dumps(insights), None)
+    ]
+    for insightType in INSIGHT_TYPES:
+        benchmarks.append(('insight.{}'.format(insightType),
+                           lambda insightType=insightType: collection.genInsight(insightType),
+                           lambda: resetCollection(collection)))
+    return benchmarks
+
+
+def isSelected(name, patterns):
+    return patterns is None or any(fnmatch(name, pattern) for pattern in patterns)
+
+
+def runSuite(sizes, seed=0, repeat=DEFAULT_REPEAT, patterns=None, log=sys.stderr):
+    results = {}
+    for size in sizes:
+        log.write('{} items: generating...\n'.format(size))
+        payload = genCollection(size, seed)
+        for name, fn, setup in getBenchmarks(payload):
+            if not isSelected(name, patterns):
+                continue
+            results.setdefault(name, {})[str(size)] = timeCall(fn, setup, repeat)
+        log.write('{} items: done\n'.format(size))
+    return results
+
+
+def getMeta(sizes, seed, repeat):
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine(),
+            'processor': platform.processor(), 'system': platform.system(), 'sizes': sizes, 'seed': seed,
+            'repeat': repeat, 'createdAt': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+
+# Log-Log Slope of Time Against Size: ~1 Linear, ~2 Quadratic
+def getScalingExponent(timings):
+    points = [(int(size), timing['min']) for size, timing in timings.items()
+              if int(size) >= MIN_SCALING_SIZE and timing['min'] > 0]
+    if len(points) < 2:
+        return None
+    sizes, times = zip(*points)
+    return float(np.polyfit(np.log(sizes), np.log(times), 1)[0])
+
+
+def formatSeconds(seconds):
+    if seconds is None:
+        return '-'
+    if seconds < 1e-3:
+        return '{:.1f}us'.format(seconds * 1e6)
+    if seconds < 1:
+        return '{:.2f}ms'.format(seconds * 1e3)
+    return '{:.2f}s'.format(seconds)
+
+
+def formatTable(rows):
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = []
+    for row in rows:
+        lines.append('  '.join(cell.ljust(widths[i]) if i == 0 else cell.rjust(widths[i])
+                               for i, cell in enumerate(row)))
+    return '\n'.join(lines)
+
+
+def formatResults(results, sizes):
+    rows = [['benchmark'] + [str(size) for size in sizes] + ['exponent']]
+    for name, timings in results.items():
+        exponent = getScalingExponent(timings)
+        rows.append([name] + [formatSeconds(timings.get(str(size), {}).get('min')) for size in sizes] +
+                    ['-' if exponent is None else '{:.2f}'.format(exponent)])
+    return formatTable(rows)
+
+
+# Compares Best-of-N Times, Which Are Far Less Noisy Than Means on a Shared Box
+def compareResults(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    comparisons = []
+    for name, timings in results.items():
+        for size, timing in timings.items():
+            baselineTiming = baseline.get(name, {}).get(size)
+            if baselineTiming is None or baselineTiming['min'] <= 0:
+                continue
+            ratio = timing['min'] / baselineTiming['min']
+            if ratio > 1 + tolerance:
+                change = 'slower'
+            elif ratio < 1 / (1 + tolerance):
+                change = 'faster'
+            else:
+                change = 'same'
+            comparisons.append({'name': name, 'size': size, 'baseline': baselineTiming['min'],
+                                'current': timing['min'], 'ratio': ratio, 'change': change})
+    return comparisons
+
+
+def formatComparisons(comparisons):
+    rows = [['benchmark', 'size', 'baseline', 'current', 'ratio', '']]
+    for c in comparisons:
+        rows.append([c['name'], c['size'], formatSeconds(c['baseline']), formatSeconds(c['current']),
+                     '{:.2f}x'.format(c['ratio']), '' if c['change'] == 'same' else c['change']])
+    return formatTable(rows)
+
+
+def getMetaWarnings(meta, baselineMeta):
+    return ['baseline {} is {}, this run is {}'.format(key, baselineMeta.get(key), meta[key])
+            for key in ['python', 'numpy', 'machine', 'processor', 'seed']
+            if baselineMeta.get(key) != meta[key]]
+
+
+def parseArgs(args):
+    parser = argparse.ArgumentParser(description='Time insights, collection parsing, fits and serialization.')
+    parser.add_argument('--sizes', default=','.join(str(x) for x in DEFAULT_SIZES),
+                        help='comma-separated collection sizes')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='runs per benchmark, best one counts')
+    parser.add_argument('--only', help='comma-separated benchmark name patterns, e.g. "insight.*,genAllInsights"')
+    parser.add_argument('--output', help='write results as JSON (use it later as --baseline)')
+    parser.add_argument('--baseline', help='compare against results saved with --output')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='relative change reported as slower/faster')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='exit with status 1 if anything is slower than the baseline')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    args = parseArgs(args)
+    sizes = [int(x) for x in args.sizes.split(',')]
+    patterns = None if args.only is None else [x.strip() for x in args.only.split(',')]
+
+    # Read the Baseline First, a Bad Path Should Not Cost a Full Run
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    meta = getMeta(sizes, args.seed, args.repeat)
+    results = runSuite(sizes, args.seed, args.repeat, patterns)
+    if args.output is not None:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump({'meta': meta, 'results': results}, f, indent=2)
+    print(formatResults(results, sizes))
+
+    if baseline is not None:
+        for warning in getMetaWarnings(meta, baseline['meta']):
+            print('warning: {}'.format(warning))
+        comparisons = compareResults(results, baseline['results'], args.tolerance)
+        print()
+        print(formatComparisons(comparisons))
+        if args.fail_on_regression and any(c['change'] == 'slower' for c in comparisons):
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
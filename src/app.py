@@ -1,44 +1,422 @@
-from flask import Flask, request
-from json import loads
+from flask import Flask, Response, request, stream_with_context
 from flask_restful import Resource, Api, reqparse
 import requests
-from .classes.collection import Collection
-from .utils import getCurveFit, getBestCurveFit
+import hashlib
+import json
+import time
+from threading import Lock
+from .batch import iterBatchResults
+from .cache import TTLCache
+from .classes.collection import Collection, DEADLINE_EXCEEDED, INSIGHT_TYPES, normalizeInsights, orderByCost, \
+    resolveInsightTypes
+from .classes.projection import Projection
+from .config import INSIGHT_CACHE_SIZE, INSIGHT_CACHE_TTL, INSIGHT_RESULT_CACHE_SIZE, INSIGHT_RESULT_CACHE_TTL, \
+    INSIGHT_SWR, INSIGHT_STALE_TTL, REFRESH_QUEUE_SIZE, \
+    REFRESH_WORKERS, JOB_WORKERS, JOB_RESULT_TTL, JOB_QUEUE_SIZE, JOB_TIMEOUT, INSIGHT_BUDGET, INSIGHT_DEADLINE, \
+    STATE_CACHE_SIZE, STATE_TTL
+from .ingest import STREAM_CHUNK_SIZE, iterBatchStream
+from .jobs import JobStore
+from .metrics import getCounters, incrementCounter
+from .refresh import RefreshQueue
+from .state import CollectionStore
+from .upstream import fetchCollection
+from .utils import getCurveFit, getBestCurveFit, DEFAULT_FIT_ENGINE, fitCache
 
-# Config (TEMP)
-# API_ROOT_URL = 'https://sn-bgg-server.herokuapp.com'
-API_ROOT_URL = "http://localhost:5000"
+RESPONSE_FORMATS = ['full', 'normalized']
+RESPONSE_OPTIONS = ['fields', 'exclude', 'format', 'budget', 'deadline']
+STREAM_FORMATS = {'ndjson': 'application/x-ndjson',
+                  'sse': 'text/event-stream'}
+
+insightsCache = TTLCache(INSIGHT_CACHE_SIZE, INSIGHT_CACHE_TTL)
+
+# Single Insights by Input Fingerprints, So a Re-Sent Collection Only Recomputes What Changed
+insightResultCache = TTLCache(INSIGHT_RESULT_CACHE_SIZE, INSIGHT_RESULT_CACHE_TTL)
+
+# Last Computed Result per (Id, Type, Options), Served Stale While a Refresh Runs
+latestInsights = TTLCache(INSIGHT_CACHE_SIZE, INSIGHT_STALE_TTL)
+
+# Views Served per Id, Bounded Like latestInsights and Pruned of Views It No Longer Holds
+collectionViews = TTLCache(INSIGHT_CACHE_SIZE, INSIGHT_STALE_TTL)
+collectionViewsLock = Lock()
+refreshQueue = RefreshQueue(REFRESH_QUEUE_SIZE, REFRESH_WORKERS)
+
+jobStore = JobStore(JOB_WORKERS, JOB_RESULT_TTL, JOB_QUEUE_SIZE, JOB_TIMEOUT)
+
+collectionStore = CollectionStore(STATE_CACHE_SIZE, STATE_TTL)
 
 app = Flask(__name__)
 api = Api(app)
 
 
+def getRequestProjection():
+    return Projection.fromArgs(request.args.get('fields'), request.args.get('exclude'))
+
+
+def getRequestFormat():
+    responseFormat = request.args.get('format', 'full')
+    if responseFormat not in RESPONSE_FORMATS:
+        raise ValueError('Unknown response format: {}'.format(responseFormat))
+    return responseFormat
+
+
+def getDeadlineSeconds(name, value, default):
+    try:
+        seconds = default if value is None else float(value)
+    except ValueError:
+        seconds = -1
+    if seconds < 0:
+        raise ValueError('Invalid {}: {}'.format(name, value))
+    return seconds or None
+
+
+def getRequestDeadlines():
+    return (getDeadlineSeconds('budget', request.args.get('budget'), INSIGHT_BUDGET),
+            getDeadlineSeconds('deadline', request.args.get('deadline'), INSIGHT_DEADLINE))
+
+
+def trackTimedOut(onInsight=None):
+    timedOut = []
+
+    def track(insight):
+        if insight.status == DEADLINE_EXCEEDED:
+            timedOut.append(insight.type)
+        if onInsight is not None:
+            onInsight(insight)
+    return timedOut, track
+
+
+def getTimedOutHeaders(timedOut):
+    if timedOut == []:
+        return {}
+    return {'X-Insights-Timed-Out': ','.join(timedOut)}
+
+
+def getRequestStream(responseFormat):
+    streamFormat = request.args.get('stream')
+    if streamFormat is None:
+        return None
+    if streamFormat not in STREAM_FORMATS:
+        raise ValueError('Unknown stream format: {}'.format(streamFormat))
+    if responseFormat != 'full' or isAsyncRequest():
+        raise ValueError('Streaming only supports the full format, without async.')
+    return streamFormat
+
+
+def encodeStreamedInsight(insight, streamFormat):
+    line = json.dumps({'type': insight.type, 'data': insight.data})
+    if streamFormat == 'sse':
+        return 'event: insight\ndata: {}\n\n'.format(line)
+    return line + '\n'
+
+
+def streamInsightsResponse(collection, insightTypes, projection, streamFormat, deadlines=(None, None)):
+    budget, insightDeadline = deadlines
+
+    # Cheap Insights Go Out First, Each as Soon as It Is Done
+    def generate():
+        timedOut, track = trackTimedOut()
+        for insight in collection.iterInsights(orderByCost(insightTypes), projection=projection,
+                                               budget=budget, insightDeadline=insightDeadline):
+            track(insight)
+            if insight.status == 'ok':
+                yield encodeStreamedInsight(insight, streamFormat)
+
+        # Headers Are Long Gone, Skipped Insights Are Listed at the End Instead
+        done = json.dumps({'timedOut': timedOut}) if timedOut != [] else '{}'
+        if streamFormat == 'sse':
+            yield 'event: done\ndata: {}\n\n'.format(done)
+        elif timedOut != []:
+            yield done + '\n'
+
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    return Response(generate(), mimetype=STREAM_FORMATS[streamFormat], headers=headers)
+
+
+def isAsyncRequest():
+    return request.args.get('async', 'false').lower() in ['1', 'true']
+
+
+def submitInsightsJob(insightTypes, run):
+    job = jobStore.submit(len(insightTypes), run)
+    if job is None:
+        incrementCounter('jobsRejected')
+        return {'error': 'Too many jobs queued, try again later.'}, 503
+    return job.toDict(), 202, {'Location': '/jobs/{}'.format(job.id)}
+
+
+def getRequestOptions():
+    return tuple((key, request.args.get(key)) for key in RESPONSE_OPTIONS)
+
+
+def getInsightsCacheKey(id, type, options, fingerprint):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((id, type, options, fingerprint)).encode())
+    return digest.hexdigest()
+
+
+def genInsightsResponse(collection, type, insightTypes, projection, responseFormat, onInsight=None,
+                        deadlines=(None, None), cached=False, resultCache=None):
+    budget, insightDeadline = deadlines
+    if responseFormat == 'normalized':
+        return normalizeInsights(collection.genInsights(insightTypes, projection=projection, onInsight=onInsight,
+                                                        budget=budget, insightDeadline=insightDeadline, cached=cached,
+                                                        resultCache=resultCache))
+
+    # A Single Insight Type Keeps Its Bare Data Response
+    if type in INSIGHT_TYPES:
+        if cached:
+            return collection.genCachedInsight(type, projection).data
+        if resultCache is not None:
+            return collection.genReusedInsights([type], resultCache, projection=projection)[0].data
+        return collection.genInsight(type, projection).data
+    return collection.genInsights(insightTypes, projection=projection, onInsight=onInsight,
+                                  budget=budget, insightDeadline=insightDeadline, cached=cached,
+                                  resultCache=resultCache)
+
+
+def parseAndGenInsights(chunks, type, insightTypes, projection, responseFormat, onInsight=None,
+                        deadlines=(None, None)):
+    try:
+        collection = Collection.fromStream(chunks)
+    except:
+        return {'error': 'Collection could not be parsed.'}, 500
+    timedOut, track = trackTimedOut(onInsight)
+    response = genInsightsResponse(collection, type, insightTypes, projection, responseFormat, track, deadlines,
+                                   resultCache=insightResultCache)
+    return response, 200, getTimedOutHeaders(timedOut)
+
+
+def fetchAndGenInsights(id, type, options, onInsight=None):
+    try:
+        insights, cacheKey, isCached, timedOut = computeInsightsView(
+            id, type, options, fetchCollection(id), onInsight)
+    except requests.RequestException:
+        return {'error': 'Collection could not be fetched.'}, 502
+    return insights, 200, getTimedOutHeaders(timedOut)
+
+
+def computeInsightsView(id, type, options, upstreamCollection, onInsight=None):
+    cacheKey = getInsightsCacheKey(
+        id, type, options, upstreamCollection.fingerprint)
+    insights = insightsCache.get(cacheKey)
+    isCached = insights is not None
+    timedOut = []
+    if not isCached:
+        optionArgs = dict(options)
+        projection = Projection.fromArgs(
+            optionArgs['fields'], optionArgs['exclude'])
+        deadlines = (getDeadlineSeconds('budget', optionArgs['budget'], INSIGHT_BUDGET),
+                     getDeadlineSeconds('deadline', optionArgs['deadline'], INSIGHT_DEADLINE))
+        timedOut, track = trackTimedOut(onInsight)
+        insights = genInsightsResponse(upstreamCollection.getCollection(), type, resolveInsightTypes(type),
+                                       projection, optionArgs['format'] or 'full', track, deadlines,
+                                       resultCache=insightResultCache)
+
+        # Partial Results Are Never Cached or Served Stale
+        if timedOut != []:
+            return insights, cacheKey, isCached, timedOut
+        insightsCache.set(cacheKey, insights)
+
+    latestInsights.set((id, type, options), {
+        'insights': insights, 'cacheKey': cacheKey, 'storedAt': time.monotonic()})
+    addCollectionViews(id, {(type, options)})
+    return insights, cacheKey, isCached, timedOut
+
+
+def addCollectionViews(id, views):
+    with collectionViewsLock:
+        views = views | collectionViews.get(id, set())
+        collectionViews.set(id, {view for view in views if (id,) + view in latestInsights})
+
+
+def refreshCollectionViews(id):
+    with collectionViewsLock:
+        views = collectionViews.get(id, set())
+        collectionViews.delete(id)
+
+    # One Upstream Fetch Refreshes Every View Still Being Served for the Id
+    try:
+        upstreamCollection = fetchCollection(id)
+        for type, options in views:
+            if latestInsights.get((id, type, options)) is not None:
+                computeInsightsView(id, type, options, upstreamCollection)
+    except Exception:
+        addCollectionViews(id, views)
+        raise
+
+
 class InsightsPost(Resource):
     def post(self, type):
         try:
-            collection = Collection(request.get_json())
-        except:
-            return {'error': 'Collection could not be parsed.'}, 500
+            insightTypes = resolveInsightTypes(type)
+            responseFormat = getRequestFormat()
+            streamFormat = getRequestStream(responseFormat)
+            deadlines = getRequestDeadlines()
+        except ValueError as e:
+            return {'error': str(e)}, 400
 
-        if type == 'all':
-            response = collection.genAllInsights()
-        else:
-            response = collection.genInsight(type).data
-        return response, 200
+        chunks = iter(lambda: request.stream.read(STREAM_CHUNK_SIZE), b'')
+        projection = getRequestProjection()
+        if streamFormat is not None:
+            try:
+                collection = Collection.fromStream(chunks)
+            except:
+                return {'error': 'Collection could not be parsed.'}, 500
+            return streamInsightsResponse(collection, insightTypes, projection, streamFormat, deadlines)
+
+        if isAsyncRequest():
+
+            # The Request Body Is Gone Once We Return, Read It Before Handing Off
+            chunks = list(chunks)
+            return submitInsightsJob(insightTypes, lambda job: parseAndGenInsights(
+                chunks, type, insightTypes, projection, responseFormat, job.advance, deadlines))
+
+        return parseAndGenInsights(chunks, type, insightTypes, projection, responseFormat, deadlines=deadlines)
 
 
 class InsightsGet(Resource):
     def get(self, id, type):
-        response = requests.get(
-            '{}/collections/{}/enrich?filter=boardgames,plays'.format(API_ROOT_URL, id))
+        try:
+            insightTypes = resolveInsightTypes(type)
+            streamFormat = getRequestStream(getRequestFormat())
+            deadlines = getRequestDeadlines()
+        except ValueError as e:
+            return {'error': str(e)}, 400
+
+        options = getRequestOptions()
+        if streamFormat is not None:
+            try:
+                upstreamCollection = fetchCollection(id)
+            except requests.RequestException:
+                return {'error': 'Collection could not be fetched.'}, 502
+            return streamInsightsResponse(upstreamCollection.getCollection(), insightTypes, getRequestProjection(),
+                                          streamFormat, deadlines)
 
-        collection = Collection(loads(response.content))
+        if isAsyncRequest():
+            return submitInsightsJob(insightTypes, lambda job: fetchAndGenInsights(id, type, options, job.advance))
 
-        if type == 'all':
-            insights = collection.genAllInsights()
+        latest = latestInsights.get((id, type, options)) if INSIGHT_SWR else None
+        if latest is not None:
+
+            # Past the TTL: Serve What We Have, Refresh in the Background
+            if time.monotonic() - latest['storedAt'] > INSIGHT_CACHE_TTL:
+                refreshQueue.submit(id, lambda: refreshCollectionViews(id))
+            insights, cacheKey, isCached, timedOut = latest['insights'], latest['cacheKey'], True, []
         else:
-            insights = collection.genInsight(type).data
-        return insights, 200
+            try:
+                insights, cacheKey, isCached, timedOut = computeInsightsView(
+                    id, type, options, fetchCollection(id))
+            except requests.RequestException:
+                return {'error': 'Collection could not be fetched.'}, 502
+
+        # A Partial Result Has No Stable Identity, so No ETag
+        if timedOut != []:
+            return insights, 200, getTimedOutHeaders(timedOut)
+
+        headers = {'ETag': '"{}"'.format(cacheKey)}
+        if isCached and cacheKey in request.if_none_match:
+            return '', 304, headers
+        return insights, 200, headers
+
+
+class BatchInsights(Resource):
+    def post(self, type):
+        try:
+            insightTypes = resolveInsightTypes(type)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+
+        projection = getRequestProjection()
+        chunks = iter(lambda: request.stream.read(STREAM_CHUNK_SIZE), b'')
+
+        # One NDJSON Line per Collection, Tagged With Its Position in the Batch
+        def generate():
+            for result in iterBatchResults(iterBatchStream(chunks), insightTypes, projection):
+                yield json.dumps(result) + '\n'
+
+        headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        return Response(stream_with_context(generate()), mimetype=STREAM_FORMATS['ndjson'], headers=headers)
+
+
+class CollectionStates(Resource):
+    def put(self, id):
+        try:
+            collection = Collection.fromStream(
+                iter(lambda: request.stream.read(STREAM_CHUNK_SIZE), b''))
+        except:
+            return {'error': 'Collection could not be parsed.'}, 500
+
+        state = collectionStore.put(id, collection)
+        return {'id': id, 'version': state.version, 'nItems': len(collection.items)}, 201
+
+
+class CollectionDeltas(Resource):
+    def post(self, id):
+        state = collectionStore.get(id)
+        if state is None:
+            return {'error': 'Unknown or expired collection.'}, 404
+
+        requestBody = request.get_json(silent=True)
+        deltas = requestBody.get('deltas') if isinstance(requestBody, dict) else requestBody
+        if not isinstance(deltas, list):
+            return {'error': 'Expected a list of deltas.'}, 400
+
+        # Deltas Before a Bad One Stay Applied, the Version Tells Clients Something Changed
+        with state.lock:
+            try:
+                changedInputs = state.collection.applyDeltas(deltas)
+                error = None
+            except ValueError as e:
+                error = str(e)
+            except (AttributeError, KeyError, TypeError):
+                error = 'Invalid delta.'
+            state.version += 1
+            collectionStore.touch(id, state)
+            if error is not None:
+                return {'error': error, 'version': state.version}, 400
+            return {'version': state.version, 'changedInputs': sorted(changedInputs),
+                    'nItems': len(state.collection.items)}, 200
+
+
+class CollectionStateInsights(Resource):
+    def get(self, id, type):
+        try:
+            insightTypes = resolveInsightTypes(type)
+            responseFormat = getRequestFormat()
+        except ValueError as e:
+            return {'error': str(e)}, 400
+
+        state = collectionStore.get(id)
+        if state is None:
+            return {'error': 'Unknown or expired collection.'}, 404
+
+        # Insights Whose Inputs No Delta Touched Come From the Collection's Result Cache
+        with state.lock:
+            cacheKey = getInsightsCacheKey(
+                id, type, getRequestOptions(), state.version)
+            headers = {'ETag': '"{}"'.format(cacheKey)}
+            if cacheKey in request.if_none_match:
+                return '', 304, headers
+            response = genInsightsResponse(state.collection, type, insightTypes, getRequestProjection(),
+                                           responseFormat, cached=True)
+        return response, 200, headers
+
+
+class Jobs(Resource):
+    def get(self, jobId):
+        job = jobStore.get(jobId)
+        if job is None:
+            return {'error': 'Unknown or expired job.'}, 404
+        return job.toDict(), 200
+
+
+class Metrics(Resource):
+    def get(self):
+        return {'counters': getCounters(),
+                'caches': {'fits': fitCache.getStats(), 'insights': insightsCache.getStats(),
+                           'insightResults': insightResultCache.getStats(),
+                           'latestInsights': latestInsights.getStats(), 'collections': collectionStore.getStats()},
+                'refreshQueue': refreshQueue.getStats()}, 200
 
 
 class PolyFit(Resource):
@@ -52,11 +430,13 @@ class PolyFit(Resource):
                 polyParams = [int(x) for x in args['polyparams'].split(',')]
             else:
                 polyParams = [0, 0, 0, 0, 1]
+            engine = args.get('engine', DEFAULT_FIT_ENGINE)
 
             requestBody = request.get_json()
             x = requestBody['x']
             y = requestBody['y']
-            fitObj = getCurveFit(x, y, fitDomainMin, fitDomainMax, polyParams)
+            fitObj = getCurveFit(x, y, fitDomainMin,
+                                 fitDomainMax, polyParams, engine)
             return fitObj, 200
         except:
             return {'error': 'Could not compute fit curve'}, 500
@@ -69,12 +449,14 @@ class BestPolyFit(Resource):
         args = request.args
         fitDomainMin = args['min']
         fitDomainMax = args['max']
+        engine = args.get('engine', DEFAULT_FIT_ENGINE)
 
         requestBody = request.get_json()
         x = requestBody['x']
         y = requestBody['y']
 
-        fitObject = getBestCurveFit(x, y, fitDomainMin, fitDomainMax)
+        fitObject = getBestCurveFit(
+            x, y, fitDomainMin, fitDomainMax, engine=engine)
 
         return fitObject, 200
         # except e:
@@ -84,6 +466,12 @@ class BestPolyFit(Resource):
 
 api.add_resource(InsightsPost, '/insights/<string:type>')
 api.add_resource(InsightsGet, '/insights/<string:id>/<string:type>')
+api.add_resource(BatchInsights, '/batch/insights/<string:type>')
+api.add_resource(CollectionStates, '/collections/<string:id>')
+api.add_resource(CollectionDeltas, '/collections/<string:id>/deltas')
+api.add_resource(CollectionStateInsights, '/collections/<string:id>/insights/<string:type>')
+api.add_resource(Jobs, '/jobs/<string:jobId>')
+api.add_resource(Metrics, '/metrics')
 api.add_resource(PolyFit, '/utils/fit')
 api.add_resource(BestPolyFit, '/utils/bestfit')
 
@@ -0,0 +1,87 @@
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+import requests
+from .classes.collection import Collection
+from .config import BATCH_WORKERS, BATCH_MAX_IN_FLIGHT
+from .executor import getExecutor, resetExecutor
+from .upstream import fetchCollectionNow
+
+
+def genBatchInsights(collection, insightTypes, projection):
+    try:
+        collection = Collection(collection)
+    except Exception:
+        return {'error': 'Collection could not be parsed.'}
+    return genCollectionInsights(collection, insightTypes, projection)
+
+
+def genBatchIdInsights(id, insightTypes, projection):
+    try:
+        collection = fetchCollectionNow(id).getCollection()
+    except requests.RequestException:
+        return {'error': 'Collection could not be fetched.'}
+    except Exception:
+        return {'error': 'Collection could not be parsed.'}
+    return genCollectionInsights(collection, insightTypes, projection)
+
+
+def genCollectionInsights(collection, insightTypes, projection):
+    try:
+        return {'insights': collection.genInsights(insightTypes, executor='serial', projection=projection)}
+    except Exception:
+        return {'error': 'Insights could not be computed.'}
+
+
+def iterBatchResults(entries, insightTypes, projection):
+    pool = getExecutor('process', BATCH_WORKERS)
+    pending = {}
+
+    # A Dead Worker Breaks the Whole Pool: Entries in Flight Fail, the Rest Go to a New Pool
+    def submit(fn, *args):
+        nonlocal pool
+        try:
+            return pool.submit(fn, *args), pool
+        except BrokenProcessPool:
+            pool = resetExecutor('process', BATCH_WORKERS, pool)
+            return pool.submit(fn, *args), pool
+
+    def collectDone(timeout=None):
+        nonlocal pool
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            result, submittedPool = pending.pop(future)
+            try:
+                result.update(future.result())
+            except BrokenProcessPool:
+                result['error'] = 'Worker failed.'
+                if submittedPool is pool:
+                    pool = resetExecutor('process', BATCH_WORKERS, pool)
+            except Exception:
+                result['error'] = 'Worker failed.'
+            yield result
+
+    # Bounded In-Flight Work Keeps Memory Flat, Results Go Out as They Complete
+    isParsed = True
+    try:
+        for index, (key, value) in enumerate(entries):
+            result = {'index': index}
+            if key == 'ids':
+                result['id'] = value
+                future, submittedPool = submit(
+                    genBatchIdInsights, value, insightTypes, projection)
+            else:
+                future, submittedPool = submit(
+                    genBatchInsights, value, insightTypes, projection)
+            pending[future] = result, submittedPool
+            if len(pending) >= BATCH_MAX_IN_FLIGHT:
+                yield from collectDone()
+            else:
+                yield from collectDone(timeout=0)
+    except ValueError:
+        isParsed = False
+
+    # Whatever Was Submitted Still Gets Its Result, Even After a Malformed Body
+    while pending:
+        yield from collectDone()
+    if not isParsed:
+        yield {'error': 'Batch could not be parsed.'}
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from threading import Lock
+import time
+
+
+class TTLCache:
+    def __init__(self, maxSize, ttl):
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            # Expired Entries Are Dropped on Read
+            value, storedAt = entry
+            if time.monotonic() - storedAt > self.ttl:
+                del self.entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return default
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    # Membership Leaves Recency and Hit Counts Alone, but Expired Entries Are Still Dropped
+    def __contains__(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False
+            if time.monotonic() - entry[1] > self.ttl:
+                del self.entries[key]
+                self.evictions += 1
+                return False
+            return True
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic())
+            self.entries.move_to_end(key)
+
+            # Least Recently Used Entries Go First
+            while len(self.entries) > self.maxSize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def getStats(self):
+        with self.lock:
+            return {'size': len(self.entries), 'maxSize': self.maxSize, 'ttl': self.ttl,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
@@ -22,7 +22,9 @@ class Boardgame:
         return None if self.userRating is None else self.userRating - self.averageRating
 
     def getRank(self):
-        return [x for x in self.subtypeRatings if x['name'] == 'boardgame'][0]['value']
+        ranks = [x['value'] for x in getattr(self, 'subtypeRatings', [])
+                 if x['name'] == 'boardgame']
+        return ranks[0] if ranks != [] else None
 
     def getAllStatEntries(self, stat):
-        return [x['value'] for x in getattr(self, stat)]
+        return [x['value'] for x in getattr(self, stat, [])]
@@ -1,42 +1,350 @@
-from statistics import mean, median
-from scipy.stats import pearsonr, spearmanr
+from concurrent.futures import as_completed
 from datetime import datetime
-from copy import copy
+from functools import wraps
+from itertools import chain
+import hashlib
+import time
+import numpy as np
 from .boardgame import Boardgame
+from .column import Column
 from .insight import Insight
-from ..utils import getBestCurveFit, getHighestCountKeys
-from collections import Counter
+from .insightspec import InsightSpec
+from .projection import ALL_FIELDS
+from .taxonomyindex import STAT_FIELDS, TaxonomyIndex
+from ..config import INSIGHT_EXECUTOR, INSIGHT_WORKERS
+from ..executor import getExecutor
+from ..metrics import incrementCounter
+from ..ingest import iterCollectionStream, projectItem
+from ..utils import getBestCurveFit, getExtremeIndexes, getHighestCountKeys, getPearsonCorrs, getSpearmanCorrs
 
 LAST_LOGGED_PLAY_THRESH = 180
 
+DEADLINE_EXCEEDED = 'Deadline exceeded.'
+
+COLUMN_FIELDS = ['numPlays', 'playTime', 'userRating', 'averageRating', 'bayesAverageRating', 'averageWeight',
+                 'medianPrice', 'averagePriceNew', 'yearPublished', 'minPlayers', 'maxPlayers', 'recommendedPlayers']
+
+# Filled by registerInsight, in Registration Order
+INSIGHT_TYPES = []
+INSIGHT_REGISTRY = {}
+INSIGHT_INPUTS = {}
+INSIGHT_COSTS = {}
+
+INSIGHT_GROUPS = {
+    'plays': ['mostPlayed', 'mostTimePlayed', 'leastPlayed', 'leastTimePlayed', 'avgPlays', 'avgTimePlayed', 'notPlayed'],
+    'value': ['bestValue', 'worstValue', 'avgValue'],
+    'weight': ['maxWeight', 'minWeight', 'avgWeight'],
+    'ratings': ['highestRated', 'lowestRated', 'avgRating', 'highestBggRating', 'lowestBggRating', 'avgBggRating',
+                'highestAvgRating', 'lowestAvgRating', 'avgAvgRating', 'avgRatingDiff', 'largestRatingDiff',
+                'largestPosRatingDiff', 'largestNegRatingDiff', 'top100'],
+    'correlations': ['ratingAvgRatingCorr', 'ratingWeightCorr', 'ratingRecommendedPlayersCorr', 'ratingPlayTimeCorr',
+                     'ratingMaxPlayersCorr', 'ratingPlaysCorr', 'ratingTimePlayedCorr', 'ratingPriceCorr', 'ratingYearCorr',
+                     'playsWeightCorr', 'playsPlayTimeCorr', 'playsRecommendedPlayersCorr', 'playsMaxPlayersCorr',
+                     'playsPriceCorr'],
+    'years': ['avgYear', 'mostCommonYears'],
+    'players': ['avgRecommendedPlayers', 'avgMaxPlayers', 'medianMaxPlayers', 'avgMinPlayers'],
+    'prices': ['avgPrice', 'medianPrice', 'totalPrice'],
+    'taxonomy': ['kickstarter', 'mostCommonCategory', 'mostCommonMechanic', 'mostCommonFamily', 'mostCommonPublisher',
+                 'mostCommonDesigner', 'mostCommonArtist'],
+    'all': INSIGHT_TYPES
+}
+
+# Correlation -> (X Field, Y Field, Field That Must Be Non-Zero)
+CORRELATIONS = {
+    'ratingAvgRatingCorr': ('userRating', 'averageRating', None),
+    'ratingWeightCorr': ('userRating', 'averageWeight', None),
+    'ratingRecommendedPlayersCorr': ('userRating', 'recommendedPlayers', None),
+    'ratingMaxPlayersCorr': ('userRating', 'maxPlayers', None),
+    'ratingPlayTimeCorr': ('userRating', 'playTime', None),
+    'ratingPlaysCorr': ('userRating', 'numPlays', 'numPlays'),
+    'ratingTimePlayedCorr': ('userRating', 'timePlayed', 'timePlayed'),
+    'ratingPriceCorr': ('userRating', 'medianPrice', None),
+    'ratingYearCorr': ('userRating', 'yearPublished', None),
+    'playsWeightCorr': ('numPlays', 'averageWeight', 'numPlays'),
+    'playsPlayTimeCorr': ('numPlays', 'playTime', 'numPlays'),
+    'playsRecommendedPlayersCorr': ('numPlays', 'recommendedPlayers', 'numPlays'),
+    'playsMaxPlayersCorr': ('numPlays', 'maxPlayers', 'numPlays'),
+    'playsPriceCorr': ('numPlays', 'medianPrice', 'numPlays')
+}
+
+# Item Fields and Collection Attributes Each Insight Reads (Besides id, name, image), Plus 'items' When
+# It Lists Every Item or Divides by the Item Count
+PLAYS_INPUTS = ['numPlays', 'lastLoggedPlay']
+TIME_PLAYED_INPUTS = ['numPlays', 'playTime', 'lastLoggedPlay']
+VALUE_INPUTS = ['numPlays', 'averagePriceNew', 'medianPrice']
+RATING_DIFF_INPUTS = ['userRating', 'averageRating']
+
+# Inputs Standing for a Column's Extreme Entries Only, for Insights That Show Just the Highest or Lowest
+EXTREME_INPUTS = {
+    'userRating.max': ('userRating', True),
+    'userRating.min': ('userRating', False),
+    'averageWeight.max': ('averageWeight', True),
+    'averageWeight.min': ('averageWeight', False),
+    'bayesAverageRating.max': ('bayesAverageRating', True),
+    'averageRating.max': ('averageRating', True),
+    'averageRating.min': ('averageRating', False)
+}
+
+# Rough Relative Cost per Insight (Taxonomy Gathers Games, Correlations Fit Trends)
+TAXONOMY_COST = 2
+CORRELATION_COST = 3
+
+# Per-Collection Checks, Run Once and Shared by Every Insight That Requires Them
+PRECHECKS = {
+    'recordedPlays': 'checkIfAnyRecordedPlays',
+    'recentPlays': 'checkIfRecentPlays',
+    'userRatings': 'checkIfAnyUserRatings',
+    'bggRatings': 'checkIfAnyBggRatings',
+    'avgRatings': 'checkIfAnyAvgRatings',
+    'weights': 'checkIfAnyWeights',
+    'years': 'checkIfAnyYear',
+    'recommendedPlayers': 'checkIfAnyRecommendedPlayers',
+    'maxPlayers': 'checkIfAnyMaxPlayers',
+    'minPlayers': 'checkIfAnyMinPlayers',
+    'prices': 'checkIfAnyPrices',
+    'ranks': 'checkIfAnyRanks'
+}
+PLAYED_PRECHECKS = [('recordedPlays', 'No recorded plays.')]
+RECENT_PLAYS_PRECHECKS = [('recentPlays', 'No recent logged plays.')]
+PLAYS_PRECHECKS = PLAYED_PRECHECKS + RECENT_PLAYS_PRECHECKS
+RATED_PRECHECKS = [('userRatings', 'No rated items.')]
+PLAYED_RATED_PRECHECKS = PLAYED_PRECHECKS + RATED_PRECHECKS
+MIN_CORR_ITEMS = 30
+
+# Changes to These Touch Every Insight (the Item Fields All Insights Show)
+ITEM_IDENTITY_FIELDS = ['id', 'name', 'image']
+
+# Inputs Read From the Collection Itself Rather Than Its Items
+COLLECTION_INPUTS = ['totalPlays', 'lastLoggedPlay']
+
+# Derived State, Rebuilt From the Collection Attributes
+DERIVED_FIELDS = ['memo', 'columns', 'taxonomy', 'itemIndexes', 'insightResults']
+
+
+def memoize(method):
+    @wraps(method)
+    def memoized(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self.memo:
+            self.memo[key] = method(self, *args, **kwargs)
+        return self.memo[key]
+    return memoized
+
 
 class Collection:
 
-    def __init__(self, collection):
+    def __init__(self, collection, items=None):
         for key in collection.keys():
             setattr(self, key, collection[key])
-        setattr(self, 'items', [Boardgame(x) for x in collection['items']])
+        if items is None:
+            items = [Boardgame(x) for x in collection['items']]
+        setattr(self, 'items', items)
+        self.buildIndexes()
+        self.insightResults = {}
+        self.memo = {}
+
+    @classmethod
+    def fromStream(cls, chunks):
+        collection = {}
+        items = []
+        for key, value in iterCollectionStream(chunks):
+            if key == 'items':
+                items.append(Boardgame(value))
+            else:
+                collection[key] = value
+        return cls(collection, items)
+
+    def __setattr__(self, key, value):
+        object.__setattr__(self, key, value)
+        if 'memo' in self.__dict__ and key not in DERIVED_FIELDS:
+            self.invalidate(reindex=(key == 'items'))
+
+    def invalidate(self, reindex=True):
+        if reindex:
+            self.buildIndexes()
+        self.insightResults = {}
+        self.memo = {}
+
+    # Drops Only the Cached Insights That Read One of the Changed Inputs
+    def invalidateInputs(self, changedInputs):
+        if any(field in changedInputs for field in ITEM_IDENTITY_FIELDS):
+            self.insightResults = {}
+        else:
+            self.insightResults = {insightType: insight for insightType, insight in self.insightResults.items()
+                                   if not any(field in changedInputs for field in INSIGHT_INPUTS[insightType])}
+        self.memo = {}
+
+    def buildIndexes(self):
+        self.columns = {}
+        for field in COLUMN_FIELDS:
+            self.columns[field] = Column.fromEntries(
+                [getattr(x, field, None) for x in self.items])
+        self.columns['rank'] = Column.fromEntries(
+            [x.getRank() for x in self.items])
+        self.taxonomy = TaxonomyIndex(self.items)
+        self.buildItemIndexes()
+
+    def buildItemIndexes(self):
+        self.itemIndexes = {}
+        for i, item in enumerate(self.items):
+            self.itemIndexes.setdefault(getattr(item, 'id', None), i)
+
+    def getItemIndex(self, id):
+        if id not in self.itemIndexes:
+            raise ValueError('Unknown item: {}'.format(id))
+        return self.itemIndexes[id]
+
+    def applyDeltas(self, deltas):
+        changedInputs = set()
+        extremes = self.getExtremeInputs()
+        try:
+            for delta in deltas:
+                changedInputs |= self.applyDelta(delta)
+        finally:
+            newExtremes = self.getExtremeInputs()
+            changedInputs |= {name for name in EXTREME_INPUTS if newExtremes[name] != extremes[name]}
+            self.invalidateInputs(changedInputs)
+        return changedInputs
+
+    # What an Extreme Input Shows: Its Value and Items, Plus Whether the First Entry Is Missing (Prechecks Read It)
+    def getExtremeInputs(self):
+        extremes = {}
+        for name, (field, largest) in EXTREME_INPUTS.items():
+            column = self.columns[field]
+            value, indexes = column.getExtreme(largest)
+            extremes[name] = (column.first() is None, value, self.getItemsAt(sorted(indexes)))
+        return extremes
+
+    def applyDelta(self, delta):
+        op = delta.get('op')
+        if op == 'addItem':
+            return self.addItem(delta['item'])
+        if op == 'removeItem':
+            return self.removeItem(delta['id'])
+        if op == 'updateItem':
+            return self.updateItem(delta['id'], delta['fields'])
+        if op == 'appendPlays':
+            return self.appendPlays(delta['id'], delta.get('quantity', 1), delta.get('date'))
+        raise ValueError('Unknown delta op: {}'.format(op))
+
+    # Delta Ops Edit Derived State in Place and Return the Inputs They Changed
+    def addItem(self, item):
+        item = Boardgame(projectItem(validateItemFields(item)))
+        index = len(self.items)
+        self.items.append(item)
+        for field in COLUMN_FIELDS:
+            self.columns[field].append(getattr(item, field, None))
+        self.columns['rank'].append(item.getRank())
+        self.taxonomy.appendItem(item, index)
+        self.itemIndexes.setdefault(getattr(item, 'id', None), index)
+        return self.getItemInputs(item, index)
+
+    def removeItem(self, id):
+        index = self.getItemIndex(id)
+        item = self.items.pop(index)
+        for field in COLUMN_FIELDS + ['rank']:
+            self.columns[field].remove(index)
+        self.taxonomy.removeItem(self.items, item, index)
+        self.buildItemIndexes()
+        return self.getItemInputs(item, index)
+
+    # Adding or Removing an Item Changes Membership and Only the Inputs It Has a Value For
+    def getItemInputs(self, item, index):
+        changedInputs = {'items'}
+        changedInputs.update(field for field in COLUMN_FIELDS if getattr(item, field, None) is not None)
+        changedInputs.update(stat for stat in STAT_FIELDS if item.getAllStatEntries(stat) != [])
+        if item.getRank() is not None:
+            changedInputs.add('subtypeRatings')
+
+        # Prechecks Look at the First Item Only
+        if index == 0:
+            changedInputs.update(COLUMN_FIELDS + ['subtypeRatings'])
+        return changedInputs
+
+    def updateItem(self, id, fields):
+        index = self.getItemIndex(id)
+        item = self.items[index]
+        fields = projectItem(validateItemFields(fields))
+        for field, value in fields.items():
+            setattr(item, field, value)
+            if field in COLUMN_FIELDS:
+                self.columns[field].setEntry(index, value)
+            elif field == 'subtypeRatings':
+                self.columns['rank'].setEntry(index, item.getRank())
+            elif field in STAT_FIELDS:
+                self.taxonomy.rebuildStat(self.items, field)
+        if 'id' in fields:
+            self.buildItemIndexes()
+        return set(fields)
+
+    def appendPlays(self, id, quantity=1, date=None):
+        if not isInteger(quantity):
+            raise ValueError('Invalid quantity: {!r}'.format(quantity))
+        if date is not None and not isinstance(date, str):
+            raise ValueError('Invalid date: {!r}'.format(date))
+        index = self.getItemIndex(id)
+        item = self.items[index]
+        item.numPlays = getattr(item, 'numPlays', 0) + quantity
+        self.columns['numPlays'].setEntry(index, item.numPlays)
+        changedInputs = {'numPlays'}
+
+        # Collection Attributes Are Set Directly, Bypassing Full Invalidation
+        if hasattr(self, 'totalPlays'):
+            object.__setattr__(self, 'totalPlays', self.totalPlays + quantity)
+            changedInputs.add('totalPlays')
+        if date is not None and (getattr(self, 'lastLoggedPlay', None) is None or date > self.lastLoggedPlay):
+            object.__setattr__(self, 'lastLoggedPlay', date)
+            changedInputs.add('lastLoggedPlay')
+        return changedInputs
+
+    def getColumn(self, field):
+        return self.columns[field]
+
+    # Digest of One Input Across All Items, in Item Order
+    @memoize
+    def getInputFingerprint(self, field):
+        if field in EXTREME_INPUTS:
+            return self.getInputFingerprint(EXTREME_INPUTS[field][0])
+        digest = hashlib.blake2b(digest_size=16)
+        if field in COLUMN_FIELDS:
+            column = self.columns[field]
+            digest.update(column.values.dtype.str.encode())
+            for array in [column.values, column.mask, column.floats]:
+                digest.update(array.tobytes())
+        elif field in COLLECTION_INPUTS:
+            digest.update(repr(getattr(self, field, None)).encode())
+        elif field == 'items':
+            digest.update(repr(len(self.items)).encode())
+        else:
+            digest.update(
+                repr([getattr(x, field, None) for x in self.items]).encode())
+        return digest.hexdigest()
+
+    # The id, name and image Digests Also Pin Item Count and Order
+    def getInsightFingerprint(self, insightType):
+        fields = ITEM_IDENTITY_FIELDS + INSIGHT_INPUTS[insightType]
+        return tuple(self.getInputFingerprint(field) for field in fields)
+
+    def getItemsAt(self, indexes):
+        return [self.items[i] for i in indexes]
 
     def getStatHist(self, stat):
-        allStatEntries = []
-        for item in self.items:
-            for e in item.getAllStatEntries(stat):
-                allStatEntries.append(e)
-        return Counter(allStatEntries)
-
-    def getStatGames(self, stat, statEntry):
-        statGames = []
-        for item in self.items:
-            itemStatList = item.getAllStatEntries(stat)
-            statFlag = False
-            for e in itemStatList:
-                if statEntry.lower() in e.lower():
-                    statFlag = True
-            if statFlag == True:
-                statGames.append(
-                    {'id': item.id, 'name': item.name, 'image': item.image})
-        return statGames
+        return self.taxonomy.getHist(stat)
+
+    @memoize
+    def getStatGames(self, stat, statEntry, exact=False):
+        return [{'id': item.id, 'name': item.name, 'image': item.image}
+                for item in self.getItemsAt(self.taxonomy.getItemIndexes(stat, statEntry, exact))]
+
+    # Games Under Any of the Entries, Each Game Once
+    def getStatEntriesGames(self, stat, statEntries):
+        games = [game for statEntry in statEntries for game in self.getStatGames(stat, statEntry)]
+        return list({v['id']: v for v in games}.values())
+
+    def countStatEntriesGames(self, stat, statEntries):
+        return len({self.items[i].id for statEntry in statEntries for i in self.taxonomy.getItemIndexes(stat, statEntry)})
 
+    @memoize
     def getLastLoggedPlayDiff(self):
         if hasattr(self, 'lastLoggedPlay') and self.lastLoggedPlay != None:
             lastLoggedPlay = datetime.strptime(
@@ -49,895 +357,679 @@ class Collection:
         return self.totalItems
 
     def getTotalPlaysEachItem(self):
-        return [item.numPlays for item in self.items]
+        return self.columns['numPlays'].values.tolist()
 
-    def getMostPlayed(self):
+    @memoize
+    def getTimePlayedColumn(self):
+        plays = self.columns['numPlays']
+        playTimes = self.columns['playTime']
+        return Column(plays.values * playTimes.values / 60, plays.mask & playTimes.mask)
+
+    def getExtremeItems(self, column, largest=True, k=None):
+        return self.getItemsAt(column.extremeIndexes(largest, k))
+
+    @memoize
+    def getMostPlayed(self, k=None):
         if(self.checkIfAnyRecordedPlays()):
-            plays = self.getTotalPlaysEachItem()
-            indexMaxPlays = [i for i, x in enumerate(plays) if x == max(plays)]
-            return [self.items[x] for x in indexMaxPlays]
+            return self.getExtremeItems(self.columns['numPlays'], True, k)
         else:
             return []
 
-    def getMostTimePlayed(self):
+    @memoize
+    def getMostTimePlayed(self, k=None):
         if(self.checkIfAnyRecordedPlays()):
-            plays = self.getTotalPlaysEachItem()
-            playTimes = [x.playTime for x in self.items]
-            timePlayed = [a*b/60 for a, b in zip(plays, playTimes)]
-            indexMaxPlays = [i for i, x in enumerate(
-                timePlayed) if x == max(timePlayed)]
-            return [self.items[x] for x in indexMaxPlays]
+            return self.getExtremeItems(self.getTimePlayedColumn(), True, k)
         else:
             return []
 
-    def getLeastPlayed(self):
+    @memoize
+    def getLeastPlayed(self, k=None):
         if(self.checkIfAnyRecordedPlays()):
-            plays = self.getTotalPlaysEachItem()
-            indexMinPlays = [i for i, x in enumerate(
-                plays) if x == max(min(plays), 1)]
-            return [self.items[x] for x in indexMinPlays]
+            plays = self.columns['numPlays']
+            return self.getExtremeItems(plays.filter(plays.values > 0), False, k)
         else:
             return []
 
-    def getLeastTimePlayed(self):
+    @memoize
+    def getLeastTimePlayed(self, k=None):
         if(self.checkIfAnyRecordedPlays()):
-            plays = self.getTotalPlaysEachItem()
-            playTimes = [x.playTime for x in self.items]
-            timePlayed = [a*b/60 for a, b in zip(plays, playTimes)]
-            minTimePlayed = min([x for x in timePlayed if x > 0])
-            indexMinPlays = [i for i, x in enumerate(
-                timePlayed) if x == minTimePlayed]
-            return [self.items[x] for x in indexMinPlays]
+            timePlayed = self.getTimePlayedColumn()
+            return self.getExtremeItems(timePlayed.filter(timePlayed.values > 0), False, k)
         else:
             return []
 
+    @memoize
     def getAvgPlays(self):
         if not self.checkIfAnyRecordedPlays():
             return -1
-        plays = self.getTotalPlaysEachItem()
-        return mean(plays)
+        return self.columns['numPlays'].mean()
 
+    @memoize
     def getAvgTimePlayed(self):
         if not self.checkIfAnyRecordedPlays():
             return -1
-        plays = self.getTotalPlaysEachItem()
-        playTimes = [x.playTime for x in self.items]
-        timePlayed = [a*b/60 for a, b in zip(plays, playTimes)]
-        return mean(timePlayed)
+        return self.getTimePlayedColumn().mean()
 
+    @memoize
     def getNotPlayedItems(self):
-        totalPlaysEachItem = self.getTotalPlaysEachItem()
-        indexNoPlays = [i for i, x in enumerate(totalPlaysEachItem) if x == 0]
-        notPlayedItems = [self.items[x] for x in indexNoPlays]
-        return notPlayedItems
+        plays = self.columns['numPlays'].values
+        return self.getItemsAt(np.flatnonzero(plays == 0))
 
+    def checkIfRecentPlays(self):
+        return self.getLastLoggedPlayDiff() <= LAST_LOGGED_PLAY_THRESH
+
+    @memoize
     def checkIfAnyRecordedPlays(self):
-        plays = self.getTotalPlaysEachItem()
-        for play in plays:
-            if(play != 0):
-                return True
-            else:
-                return False
+        return self.columns['numPlays'].first() not in [None, 0]
 
+    @memoize
     def checkIfAnyUserRatings(self):
-        ratings = [x.userRating for x in self.items]
-        for rating in ratings:
-            if(rating != None):
-                return True
-            else:
-                return False
+        return self.columns['userRating'].first() is not None
 
+    @memoize
     def checkIfAnyBggRatings(self):
-        ratings = [x.bayesAverageRating for x in self.items]
-        for rating in ratings:
-            if(rating != None):
-                return True
-            else:
-                return False
+        return self.columns['bayesAverageRating'].first() is not None
 
+    @memoize
     def checkIfAnyAvgRatings(self):
-        ratings = [x.averageRating for x in self.items]
-        for rating in ratings:
-            if(rating != None):
-                return True
-            else:
-                return False
+        return self.columns['averageRating'].first() is not None
 
+    @memoize
     def checkIfAnyYear(self):
-        years = [x.yearPublished for x in self.items]
-        for year in years:
-            if(year != None):
-                return True
-            else:
-                return False
+        return self.columns['yearPublished'].first() is not None
 
+    @memoize
     def checkIfAnyMaxPlayers(self):
-        players = [x.maxPlayers for x in self.items]
-        for player in players:
-            if(player != None):
-                return True
-            else:
-                return False
+        return self.columns['maxPlayers'].first() is not None
 
+    @memoize
     def checkIfAnyMinPlayers(self):
-        players = [x.minPlayers for x in self.items]
-        for player in players:
-            if(player != None):
-                return True
-            else:
-                return False
+        return self.columns['minPlayers'].first() is not None
 
+    @memoize
     def checkIfAnyRecommendedPlayers(self):
-        players = [x.recommendedPlayers for x in self.items]
-        for player in players:
-            if(player != None):
-                return True
-            else:
-                return False
+        return self.columns['recommendedPlayers'].first() is not None
 
+    @memoize
     def checkIfAnyPrices(self):
-        prices = [x.medianPrice for x in self.items]
-        for price in prices:
-            if(price != None):
-                return True
-            else:
-                return False
+        return self.columns['medianPrice'].first() is not None
 
+    @memoize
     def checkIfAnyRanks(self):
-        ranks = self.getAllRanks()
-        for rank in ranks:
-            if(rank != None):
-                return True
-            else:
-                return False
+        return self.columns['rank'].first() is not None
 
+    @memoize
     def checkIfAnyWeights(self):
-        weights = [
-            x.averageWeight for x in self.items if x.averageWeight is not None]
+        return self.columns['averageWeight'].any()
 
-        if len(weights) != 0:
-            return True
-        else:
-            return False
+    @memoize
+    def getItemsValueColumn(self):
+        plays = self.columns['numPlays'].values
+        prices = self.columns['averagePriceNew']
+        values = np.full(len(plays), -1.0)
+        np.divide(plays, prices.values, out=values, where=prices.mask)
+        return Column(values, np.ones(len(plays), dtype=bool))
 
     def getItemsValue(self):
-        return [x.getItemValue() for x in self.items]
+        return self.getItemsValueColumn().values.tolist()
 
-    def getMostExpensive(self):
-        itemPrices = [
-            x.medianPrice for x in self.items if x.medianPrice != None]
-        itemsNotNone = [x for x in self.items if x.medianPrice != None]
-        maxIndex = itemPrices.index(max(itemPrices))
-        return itemsNotNone[maxIndex]
+    def getMostExpensive(self, mask=None):
+        prices = self.columns['medianPrice']
+        if mask is not None:
+            prices = prices.filter(mask)
+        return self.items[prices.argMax()]
 
     def getLeastExpensive(self):
-        itemPrices = [
-            x.medianPrice for x in self.items if x.medianPrice != None]
-        itemsNotNone = [x for x in self.items if x.medianPrice != None]
-        minIndex = itemPrices.index(min(itemPrices))
-        return itemsNotNone[minIndex]
+        return self.items[self.columns['medianPrice'].argMin()]
 
+    @memoize
     def getBestValue(self):
         if not self.checkIfAnyRecordedPlays():
             return None
-        itemsValue = self.getItemsValue()
-        return max(itemsValue)
+        return self.getItemsValueColumn().values.max().item()
 
+    @memoize
     def getBestValueItem(self):
         if not self.checkIfAnyRecordedPlays():
             return self.getLeastExpensive()
+        return self.items[self.getItemsValueColumn().argMax()]
 
-        bestValue = self.getBestValue()
-        itemsValue = self.getItemsValue()
-        bestValueIndex = itemsValue.index(bestValue)
-        return self.items[bestValueIndex]
-
+    @memoize
     def getWorstValue(self):
         if not self.checkIfAnyRecordedPlays():
             return None
-        if 0 in self.getTotalPlaysEachItem():
+        if (self.columns['numPlays'].values == 0).any():
             return 0
-        itemsValue = self.getItemsValue()
-        return min(itemsValue)
+        return self.getItemsValueColumn().values.min().item()
 
+    @memoize
     def getWorstValueItem(self):
         if not self.checkIfAnyRecordedPlays():
             return self.getMostExpensive()
 
-        if 0 in self.getTotalPlaysEachItem():
-            reducedCollection = copy(self)
-            reducedCollection.items = [
-                x for x in self.items if x.numPlays == 0]
-            return reducedCollection.getMostExpensive()
+        notPlayed = self.columns['numPlays'].values == 0
+        if notPlayed.any():
+            return self.getMostExpensive(notPlayed)
 
-        itemsValue = self.getItemsValue()
-        minValue = min(itemsValue)
-        minValueIndex = itemsValue.index(minValue)
-        return self.items[minValueIndex]
+        return self.items[self.getItemsValueColumn().argMin()]
 
+    @memoize
     def getAvgValue(self):
         if not self.checkIfAnyRecordedPlays():
             return -1
-        values = [x for x in self.getItemsValue() if x != -1]
-        return mean(values)
+        values = self.getItemsValueColumn()
+        return values.filter(values.values != -1).mean()
 
     def getMaxWeightItem(self):
-        weights = [
-            x.averageWeight for x in self.items if x.averageWeight is not None]
-        itemsNotNone = [x for x in self.items if x.averageWeight is not None]
-        maxWeight = max(weights)
-        maxWeightIndex = weights.index(maxWeight)
-        return itemsNotNone[maxWeightIndex]
+        return self.items[self.columns['averageWeight'].argMax()]
 
     def getMinWeightItem(self):
-        weights = [
-            x.averageWeight for x in self.items if x.averageWeight is not None]
-        itemsNotNone = [x for x in self.items if x.averageWeight is not None]
-        minWeight = min(weights)
-        minWeightIndex = weights.index(minWeight)
-        return itemsNotNone[minWeightIndex]
+        return self.items[self.columns['averageWeight'].argMin()]
 
+    @memoize
     def getAvgWeight(self):
-        weights = [x.averageWeight
-                   for x in self.items if x.averageWeight is not None]
-        return mean(weights)
+        return self.columns['averageWeight'].mean()
 
-    def getHighestRatedItems(self):
+    @memoize
+    def getHighestRatedItems(self, k=None):
         if not self.checkIfAnyUserRatings():
             return []
-        nonNoneRatings = [x.userRating
-                          for x in self.items if x.userRating != None]
-        nonNoneRatedItems = [
-            item for item in self.items if item.userRating != None]
-        maxRatingIndexes = [i for i, x in enumerate(
-            nonNoneRatings) if x == max(nonNoneRatings)]
-        return [nonNoneRatedItems[index] for index in maxRatingIndexes]
-
-    def getLowestRatedItems(self):
+        return self.getExtremeItems(self.columns['userRating'], True, k)
+
+    @memoize
+    def getLowestRatedItems(self, k=None):
         if not self.checkIfAnyUserRatings():
             return []
-        nonNoneRatings = [x.userRating
-                          for x in self.items if x.userRating != None]
-        nonNoneRatedItems = [
-            item for item in self.items if item.userRating != None]
-        minRatingIndexes = [i for i, x in enumerate(
-            nonNoneRatings) if x == min(nonNoneRatings)]
-        return [nonNoneRatedItems[index] for index in minRatingIndexes]
+        return self.getExtremeItems(self.columns['userRating'], False, k)
 
+    @memoize
     def getAvgRating(self):
-        ratings = [x.userRating
-                   for x in self.items if x.userRating != None]
-        return mean(ratings)
+        return self.columns['userRating'].mean()
 
     def getHighestBggRating(self):
-        BggRatings = [x.bayesAverageRating for x in self.items]
-        maxBggRating = max(BggRatings)
-        maxBggRatingIndex = BggRatings.index(maxBggRating)
-        return self.items[maxBggRatingIndex]
+        return self.items[self.columns['bayesAverageRating'].argMax()]
 
     def getLowestBggRating(self):
-        BggRatings = [x.bayesAverageRating for x in self.items if x != 0]
-        nonZeroRatingItems = [
-            item for item in self.items if item.bayesAverageRating != 0]
-        minBggRating = min(BggRatings)
-        minBggRatingIndex = BggRatings.index(minBggRating)
-        return nonZeroRatingItems[minBggRatingIndex]
+        bggRatings = self.columns['bayesAverageRating']
+        return self.items[bggRatings.filter(bggRatings.values != 0).argMin()]
 
+    @memoize
     def getAvgBggRating(self):
-        bggRatings = [x.bayesAverageRating for x in self.items]
-        return mean(bggRatings)
+        return self.columns['bayesAverageRating'].mean()
 
     def getHighestAvgRating(self):
-        avgRatings = [x.averageRating for x in self.items]
-        maxAvgRating = max(avgRatings)
-        maxAvgRatingIndex = avgRatings.index(maxAvgRating)
-        return self.items[maxAvgRatingIndex]
+        return self.items[self.columns['averageRating'].argMax()]
 
+    @memoize
     def getAvgAvgRating(self):
-        avgRatings = [x.averageRating for x in self.items]
-        return mean(avgRatings)
+        return self.columns['averageRating'].mean()
 
     def getLowestAvgRating(self):
-        avgRatings = [x.averageRating for x in self.items]
-        minAvgRating = min(avgRatings)
-        minAvgRatingIndex = avgRatings.index(minAvgRating)
-        return self.items[minAvgRatingIndex]
+        return self.items[self.columns['averageRating'].argMin()]
+
+    @memoize
+    def getRatingDiffColumn(self):
+        ratings = self.columns['userRating']
+        avgRatings = self.columns['averageRating']
+        return Column(ratings.values - avgRatings.values, ratings.mask & avgRatings.mask)
 
     def getRatingDiffEachItem(self):
-        return [x.getRatingDiff() for x in self.items]
+        ratingDiffs = self.getRatingDiffColumn()
+        return [x if m else None for x, m in zip(ratingDiffs.values.tolist(), ratingDiffs.mask)]
 
+    @memoize
     def getAvgRatingDiff(self):
-        ratingDiffs = self.getRatingDiffEachItem()
-        ratingDiffsNotNone = [x for x in ratingDiffs if x is not None]
-        if ratingDiffsNotNone == []:
+        ratingDiffs = self.getRatingDiffColumn()
+        if not ratingDiffs.any():
             return None
-        return mean(ratingDiffsNotNone)
+        return ratingDiffs.mean()
 
+    @memoize
     def getLargestRatingDiffItem(self):
-        ratingDiffs = self.getRatingDiffEachItem()
-        ratingDiffsNotNone = [abs(x) for x in ratingDiffs if x is not None]
-        if ratingDiffsNotNone == []:
+        ratingDiffs = self.getRatingDiffColumn()
+        if not ratingDiffs.any():
             return []
-        maxDiff = max(ratingDiffsNotNone)
-        maxDiffIndex = ratingDiffsNotNone.index(maxDiff)
-        itemsNotNone = [x for x in self.items if
-                        x.getRatingDiff() is not None]
-        return itemsNotNone[maxDiffIndex]
+        return self.items[Column(np.abs(ratingDiffs.values), ratingDiffs.mask).argMax()]
 
+    @memoize
     def getLargestPosRatingDiffItem(self):
-        ratingDiffs = self.getRatingDiffEachItem()
-        ratingDiffsNotNone = [abs(x)
-                              for x in ratingDiffs if (x is not None and x > 0)]
-        if ratingDiffsNotNone == []:
+        ratingDiffs = self.getRatingDiffColumn()
+        ratingDiffs = ratingDiffs.filter(ratingDiffs.values > 0)
+        if not ratingDiffs.any():
             return []
-        maxDiff = max(ratingDiffsNotNone)
-        maxDiffIndex = ratingDiffsNotNone.index(maxDiff)
-        itemsNotNone = [x for x in self.items if (
-            x.getRatingDiff() is not None and x.getRatingDiff() > 0)]
-        return itemsNotNone[maxDiffIndex]
+        return self.items[ratingDiffs.argMax()]
 
+    @memoize
     def getLargestNegRatingDiffItem(self):
-        ratingDiffs = self.getRatingDiffEachItem()
-        ratingDiffsNotNone = [abs(x)
-                              for x in ratingDiffs if (x is not None and x < 0)]
-        if ratingDiffsNotNone == []:
+        ratingDiffs = self.getRatingDiffColumn()
+        ratingDiffs = ratingDiffs.filter(ratingDiffs.values < 0)
+        if not ratingDiffs.any():
             return []
-        maxDiff = max(ratingDiffsNotNone)
-        maxDiffIndex = ratingDiffsNotNone.index(maxDiff)
-        itemsNotNone = [x for x in self.items if (
-            x.getRatingDiff() is not None and x.getRatingDiff() < 0)]
-        return itemsNotNone[maxDiffIndex]
+        return self.items[ratingDiffs.argMin()]
+
+    @memoize
+    def getCorrelations(self):
+        columns = dict(self.columns, timePlayed=self.getTimePlayedColumn())
+
+        # One Row per Correlation, Masked Where Either Value Is Missing
+        xs = np.zeros((len(CORRELATIONS), len(self.items)))
+        ys = np.zeros((len(CORRELATIONS), len(self.items)))
+        masks = np.zeros((len(CORRELATIONS), len(self.items)), dtype=bool)
+        for i, (xField, yField, nonZeroField) in enumerate(CORRELATIONS.values()):
+            xs[i] = columns[xField].values
+            ys[i] = columns[yField].values
+            masks[i] = columns[xField].mask & columns[yField].mask
+            if nonZeroField is not None:
+                masks[i] &= columns[nonZeroField].values != 0
+
+        pearsonCorrs = getPearsonCorrs(xs, ys, masks)
+        spearmanCorrs = getSpearmanCorrs(xs, ys, masks)
+
+        correlations = {}
+        for i, name in enumerate(CORRELATIONS.keys()):
+            if masks[i].sum() < 2:
+                correlations[name] = None
+            else:
+                correlations[name] = {
+                    'pearsonr': pearsonCorrs[i].item(), 'spearmanr': spearmanCorrs[i].item()}
+        return correlations
 
     def getRatingAvgRatingCorr(self):
         if not self.checkIfAnyUserRatings():
             return None
-        ratings = [x.userRating for x in self.items]
-        avgRatings = [x.averageRating for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.userRating is not None]
-
-        notNoneRatings = [ratings[index] for index in notNoneIndexes]
-        notNoneAvgRatings = [avgRatings[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNoneAvgRatings)
-        spearmanCorr = spearmanr(notNoneRatings, notNoneAvgRatings)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['ratingAvgRatingCorr']
 
     def getRatingWeightCorr(self):
         if not self.checkIfAnyUserRatings():
             return None
-        ratings = [x.userRating for x in self.items]
-        weights = [x.averageWeight for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.userRating is not None and x.averageWeight is not None]
-
-        notNoneRatings = [ratings[index] for index in notNoneIndexes]
-        notNoneWeights = [weights[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNoneWeights)
-        spearmanCorr = spearmanr(notNoneRatings, notNoneWeights)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['ratingWeightCorr']
 
     def getRatingRecommendedPlayersCorr(self):
         if not self.checkIfAnyUserRatings():
             return None
-        ratings = [x.userRating for x in self.items]
-        recommendedPlayers = [x.recommendedPlayers for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.userRating is not None]
-
-        notNoneRatings = [ratings[index] for index in notNoneIndexes]
-        notNoneRecommendedPlayers = [
-            recommendedPlayers[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNoneRecommendedPlayers)
-        spearmanCorr = spearmanr(notNoneRatings, notNoneRecommendedPlayers)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr }
+        return self.getCorrelations()['ratingRecommendedPlayersCorr']
 
     def getRatingMaxPlayersCorr(self):
         if not self.checkIfAnyUserRatings():
             return None
-        ratings = [x.userRating for x in self.items]
-        maxPlayers = [x.maxPlayers for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.userRating is not None]
-
-        notNoneRatings = [ratings[index] for index in notNoneIndexes]
-        notNoneMaxPlayers = [
-            maxPlayers[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNoneMaxPlayers)
-        spearmanCorr = spearmanr(notNoneRatings, notNoneMaxPlayers)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['ratingMaxPlayersCorr']
 
     def getRatingPlayTimeCorr(self):
         if not self.checkIfAnyUserRatings():
             return None
-        ratings = [x.userRating for x in self.items]
-        playTimes = [x.playTime for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.userRating is not None]
-
-        notNoneRatings = [ratings[index] for index in notNoneIndexes]
-        notNonePlayTimes = [playTimes[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNonePlayTimes)
-        spearmanCorr = spearmanr(notNoneRatings, notNonePlayTimes)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['ratingPlayTimeCorr']
 
     def getRatingPlaysCorr(self):
         if not self.checkIfAnyUserRatings() or not self.checkIfAnyRecordedPlays():
             return None
-        ratings = [x.userRating for x in self.items]
-        plays = self.getTotalPlaysEachItem()
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.userRating is not None and x.numPlays != 0]
-
-        notNoneRatings = [ratings[index] for index in notNoneIndexes]
-        notNonePlays = [plays[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNonePlays)
-        spearmanCorr = spearmanr(notNoneRatings, notNonePlays)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['ratingPlaysCorr']
 
     def getRatingTimePlayedCorr(self):
         if not self.checkIfAnyUserRatings() or not self.checkIfAnyRecordedPlays():
             return None
-        ratings = [x.userRating for x in self.items]
-        plays = self.getTotalPlaysEachItem()
-        playTimes = [x.playTime for x in self.items]
-        timePlayed = [a*b/60 for a, b in zip(plays, playTimes)]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.userRating is not None and x.numPlays != 0 and x.playTime != 0]
-
-        notNoneRatings = [ratings[index] for index in notNoneIndexes]
-        notNoneTimePlayed = [timePlayed[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNoneTimePlayed)
-        spearmanCorr = spearmanr(notNoneRatings, notNoneTimePlayed)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['ratingTimePlayedCorr']
 
     def getRatingPriceCorr(self):
         if not self.checkIfAnyUserRatings():
             return None
-        ratings = [x.userRating for x in self.items]
-        prices = [x.medianPrice for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.userRating is not None and x.medianPrice is not None]
-
-        notNoneRatings = [ratings[index] for index in notNoneIndexes]
-        notNonePrices = [prices[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNonePrices)
-        spearmanCorr = spearmanr(notNoneRatings, notNonePrices)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['ratingPriceCorr']
 
     def getRatingYearCorr(self):
         if not self.checkIfAnyUserRatings():
             return None
-        ratings = [x.userRating for x in self.items]
-        years = [x.yearPublished for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.userRating is not None and x.yearPublished is not None]
-
-        notNoneRatings = [ratings[index] for index in notNoneIndexes]
-        notNoneYears = [years[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNoneYears)
-        spearmanCorr = spearmanr(notNoneRatings, notNoneYears)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['ratingYearCorr']
 
     def getPlaysWeightCorr(self):
         if not self.checkIfAnyRecordedPlays():
             return None
-        plays = self.getTotalPlaysEachItem()
-        weights = [x.averageWeight for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.numPlays != 0 and x.averageWeight is not None]
-
-        notNonePlays = [plays[index] for index in notNoneIndexes]
-        notNoneWeights = [weights[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNonePlays, notNoneWeights)
-        spearmanCorr = spearmanr(notNonePlays, notNoneWeights)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['playsWeightCorr']
 
     def getPlaysPlayTimeCorr(self):
         if not self.checkIfAnyRecordedPlays():
             return None
-        plays = [x.numPlays for x in self.items]
-        playTimes = [x.playTime for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.numPlays != 0]
-        notNonePlays = [plays[index] for index in notNoneIndexes]
-        notNonePlayTimes = [playTimes[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNonePlays, notNonePlayTimes)
-        spearmanCorr = spearmanr(notNonePlays, notNonePlayTimes)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['playsPlayTimeCorr']
 
     def getPlaysRecommendedPlayersCorr(self):
         if not self.checkIfAnyRecordedPlays():
             return None
-        plays = [x.numPlays for x in self.items]
-        recommendedPlayers = [x.recommendedPlayers for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.numPlays != 0]
-
-        notNoneRatings = [plays[index] for index in notNoneIndexes]
-        notNoneRecommendedPlayers = [
-            recommendedPlayers[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNoneRecommendedPlayers)
-        spearmanCorr = spearmanr(notNoneRatings, notNoneRecommendedPlayers)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['playsRecommendedPlayersCorr']
 
     def getPlaysMaxPlayersCorr(self):
         if not self.checkIfAnyRecordedPlays():
             return None
-        plays = [x.numPlays for x in self.items]
-        maxPlayers = [x.maxPlayers for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.numPlays != 0]
-
-        notNoneRatings = [plays[index] for index in notNoneIndexes]
-        notNoneMaxPlayers = [
-            maxPlayers[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNoneMaxPlayers)
-        spearmanCorr = spearmanr(notNoneRatings, notNoneMaxPlayers)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['playsMaxPlayersCorr']
 
     def getPlaysPriceCorr(self):
         if not self.checkIfAnyRecordedPlays():
             return None
-        plays = self.getTotalPlaysEachItem()
-        prices = [x.medianPrice for x in self.items]
-        notNoneIndexes = [i for i, x in enumerate(
-            self.items) if x.medianPrice is not None and x.numPlays != 0]
-
-        notNoneRatings = [plays[index] for index in notNoneIndexes]
-        notNonePrices = [
-            prices[index] for index in notNoneIndexes]
-
-        pearsonCorr = pearsonr(notNoneRatings, notNonePrices)
-        spearmanCorr = spearmanr(notNoneRatings, notNonePrices)
-
-        if type(pearsonCorr) is tuple:
-            return None
-
-        if type(spearmanCorr) is tuple:
-            return None
-
-        return {'pearsonr': pearsonCorr, 'spearmanr': spearmanCorr}
+        return self.getCorrelations()['playsPriceCorr']
 
+    @memoize
     def getAvgYear(self):
-        years = [x.yearPublished for x in self.items if x.yearPublished is not None]
-        return int(mean(years))
+        return int(self.columns['yearPublished'].mean())
 
+    @memoize
     def getYearOccurrences(self):
-        years = [x.yearPublished for x in self.items]
-        yearSet = set(years)
-        occurences = {}
-        for year in yearSet:
-            occurences[year] = years.count(year)
+        years = self.columns['yearPublished']
+        yearSet, counts = np.unique(years.notNone(), return_counts=True)
+        occurences = dict(zip(yearSet.tolist(), counts.tolist()))
+        if not years.mask.all():
+            occurences[None] = int((~years.mask).sum())
         return occurences
 
+    @memoize
     def getAvgRecommendedPlayers(self):
-        recommendedPlayers = [x.recommendedPlayers for x in self.items]
-        return mean(recommendedPlayers)
+        return self.columns['recommendedPlayers'].mean()
 
+    @memoize
     def getAvgMaxPlayers(self):
-        maxPlayers = [x.maxPlayers for x in self.items]
-        return mean(maxPlayers)
+        return self.columns['maxPlayers'].mean()
 
+    @memoize
     def getMedianMaxPlayers(self):
-        maxPlayers = [x.maxPlayers for x in self.items]
-        return median(maxPlayers)
+        return self.columns['maxPlayers'].median()
 
+    @memoize
     def getAvgMinPlayers(self):
-        minPlayers = [x.minPlayers for x in self.items]
-        return mean(minPlayers)
+        return self.columns['minPlayers'].mean()
 
+    @memoize
     def getAvgPrice(self):
-        prices = [x.medianPrice
-                  for x in self.items if x.medianPrice is not None and x.medianPrice <= 500]
-        return mean(prices)
+        prices = self.columns['medianPrice']
+        return prices.filter(prices.values <= 500).mean()
 
+    @memoize
     def getMedianPrice(self):
-        prices = [x.medianPrice
-                  for x in self.items if x.medianPrice is not None]
-        return median(prices)
+        return self.columns['medianPrice'].median()
 
+    @memoize
     def getTotalPrice(self):
-        prices = [x.medianPrice
-                  for x in self.items if x.medianPrice is not None and x.medianPrice <= 500]
-        return sum(prices)
+        prices = self.columns['medianPrice']
+        return prices.filter(prices.values <= 500).sum()
 
     def getAllRanks(self):
         return [x.getRank() for x in self.items]
 
-    def genInsight(self, insightType):
-
-        if insightType == 'mostPlayed':
-            return genInsightMostPlayed(self)
-
-        if insightType == 'mostTimePlayed':
-            return genInsightMostTimePlayed(self)
-
-        if insightType == 'leastPlayed':
-            return genInsightLeastPlayed(self)
-
-        if insightType == 'leastTimePlayed':
-            return genInsightLeastTimePlayed(self)
-
-        if insightType == 'avgPlays':
-            return genInsightAvgPlays(self)
-
-        if insightType == 'avgTimePlayed':
-            return genInsightAvgTimePlayed(self)
-
-        if insightType == 'notPlayed':
-            return genInsightNotPlayed(self)
-
-        if insightType == 'bestValue':
-            return genInsightBestValue(self)
+    def genInsight(self, insightType, projection=ALL_FIELDS):
+        insight = self.buildInsight(insightType)
+        if insight is not None:
+            insight.data = projection.apply(insight.data)
+        return insight
 
-        if insightType == 'worstValue':
-            return genInsightWorstValue(self)
-
-        if insightType == 'avgValue':
-            return genInsightAvgValue(self)
-
-        if insightType == 'maxWeight':
-            return genInsightMaxWeight(self)
-
-        if insightType == 'minWeight':
-            return genInsightMinWeight(self)
-
-        if insightType == 'avgWeight':
-            return genInsightAvgWeight(self)
-
-        if insightType == 'highestRated':
-            return genInsightHighestRated(self)
-
-        if insightType == 'lowestRated':
-            return genInsightLowestRated(self)
-
-        if insightType == 'avgRating':
-            return genInsightAvgRating(self)
-
-        if insightType == 'highestBggRating':
-            return genInsightHighestBggRating(self)
-
-        if insightType == 'lowestBggRating':
-            return genInsightLowestBggRating(self)
-
-        if insightType == 'avgBggRating':
-            return genInsightAvgBggRating(self)
-
-        if insightType == 'highestAvgRating':
-            return genInsightHighestAvgRating(self)
-
-        if insightType == 'lowestAvgRating':
-            return genInsightLowestAvgRating(self)
-
-        if insightType == 'avgAvgRating':
-            return genInsightAvgAvgRating(self)
-
-        if insightType == 'avgRatingDiff':
-            return genInsightAvgRatingDiff(self)
-
-        if insightType == 'largestRatingDiff':
-            return genInsightLargestRatingDiff(self)
-
-        if insightType == 'largestPosRatingDiff':
-            return genInsightLargestPosRatingDiff(self)
-
-        if insightType == 'largestNegRatingDiff':
-            return genInsightLargestNegRatingDiff(self)
-
-        if insightType == 'ratingAvgRatingCorr':
-            return genInsightRatingAvgRatingCorr(self)
-
-        if insightType == 'ratingWeightCorr':
-            return genInsightRatingWeightCorr(self)
-
-        if insightType == 'ratingRecommendedPlayersCorr':
-            return genInsightRatingRecommendedPlayersCorr(self)
-
-        if insightType == 'ratingPlayTimeCorr':
-            return genInsightRatingPlayTimeCorr(self)
-
-        if insightType == 'ratingMaxPlayersCorr':
-            return genInsightRatingMaxPlayersCorr(self)
-
-        if insightType == 'ratingPlaysCorr':
-            return genInsightRatingPlaysCorr(self)
-
-        if insightType == 'ratingTimePlayedCorr':
-            return genInsightRatingTimePlayedCorr(self)
+    def buildInsight(self, insightType):
+        spec = INSIGHT_REGISTRY.get(insightType)
+        if spec is None:
+            return None
+        return self.precheckInsight(spec) or spec.build(self)
+
+    @memoize
+    def getPrechecks(self):
+        return {name: getattr(self, check)() for name, check in PRECHECKS.items()}
+
+    # Items That Have Every itemFields Entry and No Zero in nonZeroFields (Missing Counts as Non-Zero)
+    @memoize
+    def countItems(self, itemFields=(), nonZeroFields=()):
+        mask = np.ones(len(self.items), dtype=bool)
+        for field in itemFields:
+            mask &= self.columns[field].mask
+        for field in nonZeroFields:
+            column = self.columns[field]
+            mask &= ~column.mask | (column.values != 0)
+        return int(mask.sum())
+
+    # The Failure an Insight Would Report Before Doing Any Work, or None
+    def precheckInsight(self, spec):
+        if spec.minItems and self.countItems(spec.itemFields, spec.nonZeroFields) < spec.minItems:
+            return spec.fail('Less than {} boardgames to consider.'.format(spec.minItems))
+        prechecks = self.getPrechecks()
+        for precheck, message in spec.prechecks:
+            if not prechecks[precheck]:
+                return spec.fail(message)
+        return None
+
+    # Splits Insight Types Into Those Worth Running and the Failures of the Rest
+    def planInsights(self, insightTypes, projection=ALL_FIELDS):
+        runnable = []
+        pruned = []
+        for insightType in insightTypes:
+            spec = INSIGHT_REGISTRY.get(insightType)
+            insight = None if spec is None else self.precheckInsight(spec)
+            if insight is None:
+                runnable.append(insightType)
+            else:
+                insight.data = projection.apply(insight.data)
+                pruned.append(insight)
+        return runnable, pruned
+
+    def warmSharedResults(self, insightTypes=INSIGHT_TYPES):
+        self.getPrechecks()
+        if any(insightType in CORRELATIONS for insightType in insightTypes):
+            self.getCorrelations()
+
+    def genInsightsParallel(self, insightTypes, executor, workers, projection=ALL_FIELDS):
+        pool = getInsightPool(executor, workers)
+
+        # Shared Intermediates Are Computed Once, Before the Fan-Out
+        self.warmSharedResults(insightTypes)
+        return list(pool.map(lambda insightType: self.genInsight(insightType, projection), insightTypes))
+
+    def iterInsights(self, insightTypes, executor=INSIGHT_EXECUTOR, workers=INSIGHT_WORKERS, projection=ALL_FIELDS,
+                     budget=None, insightDeadline=None):
+
+        # Yields Insights as They Complete, Not in Request Order
+        requestDeadline = time.monotonic() + budget if budget else None
+        insightTypes, prunedInsights = self.planInsights(insightTypes, projection)
+        yield from prunedInsights
+        if requestDeadline is not None or insightDeadline:
+            yield from self.iterInsightsWithDeadlines(insightTypes, requestDeadline, insightDeadline, projection)
+            return
+        if executor == 'serial':
+            for insightType in insightTypes:
+                yield self.genInsight(insightType, projection)
+            return
+
+        pool = getInsightPool(executor, workers)
+        self.warmSharedResults(insightTypes)
+        futures = [pool.submit(self.genInsight, insightType, projection)
+                   for insightType in insightTypes]
+        for future in as_completed(futures):
+            yield future.result()
+
+    def genAllInsights(self, executor=INSIGHT_EXECUTOR, workers=INSIGHT_WORKERS, projection=ALL_FIELDS):
+        return self.genInsights(INSIGHT_TYPES, executor, workers, projection)
+
+    # Cooperative: Checked Between Insights (Cheapest First), a Running Insight Is Never Interrupted
+    def iterInsightsWithDeadlines(self, insightTypes, requestDeadline, insightDeadline, projection=ALL_FIELDS):
+        for insightType in orderByCost(insightTypes):
+            startedAt = time.monotonic()
+            insight = None
+            if requestDeadline is None or startedAt < requestDeadline:
+                insight = self.genInsight(insightType, projection)
+
+                # An Insight Over Its Own Deadline Is Dropped Once It Returns
+                if insightDeadline and time.monotonic() - startedAt >= insightDeadline:
+                    insight = None
+            if insight is None:
+                insight = Insight(insightType, {}, DEADLINE_EXCEEDED)
+                incrementCounter('insightDeadlinesExceeded')
+                incrementCounter('insightDeadlinesExceeded.{}'.format(insightType))
+            yield insight
+
+    def genInsightsWithDeadlines(self, insightTypes, requestDeadline, insightDeadline, projection=ALL_FIELDS):
+        insightsByType = {insight.type: insight for insight in self.iterInsightsWithDeadlines(
+            insightTypes, requestDeadline, insightDeadline, projection)}
+        return [insightsByType[insightType] for insightType in insightTypes]
+
+    def genCachedInsight(self, insightType, projection=ALL_FIELDS):
+        if insightType not in self.insightResults:
+            self.insightResults[insightType] = self.genInsight(insightType)
+        insight = self.insightResults[insightType]
+        return Insight(insight.type, projection.apply(insight.data), insight.status)
+
+    # Results Are Keyed by Their Inputs' Fingerprints, so Any Payload With the Same Inputs Reuses Them
+    def genReusedInsights(self, insightTypes, resultCache, genMissing=None, projection=ALL_FIELDS):
+        keys = {insightType: (insightType, self.getInsightFingerprint(insightType))
+                for insightType in insightTypes}
+        insightsByType = {insightType: resultCache.get(keys[insightType])
+                          for insightType in insightTypes}
+        missing = [insightType for insightType in insightTypes
+                   if insightsByType[insightType] is None]
+        incrementCounter('insightResultsReused', len(insightTypes) - len(missing))
+        incrementCounter('insightResultsComputed', len(missing))
+
+        # A Narrower Projection Skips Work (Lazy Items, Trends), so Only Full Results Are Worth Keeping
+        if missing != []:
+            storeResults = projection.includesAll()
+            if genMissing is None:
+                missingInsights = [self.genInsight(insightType, projection) for insightType in missing]
+            else:
+                missingInsights = genMissing(missing, projection)
+            for insight in missingInsights:
+                if storeResults and insight.status != DEADLINE_EXCEEDED:
+                    resultCache.set(keys[insight.type], insight)
+                insightsByType[insight.type] = insight
+
+        return [Insight(insight.type, projection.apply(insight.data), insight.status)
+                for insight in (insightsByType[insightType] for insightType in insightTypes)]
+
+    def genComputedInsights(self, insightTypes, executor=INSIGHT_EXECUTOR, workers=INSIGHT_WORKERS,
+                            projection=ALL_FIELDS, requestDeadline=None, insightDeadline=None):
+
+        # Insights Failing a Precheck Never Reach the Executor
+        insightTypes, prunedInsights = self.planInsights(insightTypes, projection)
+        if insightTypes == []:
+            insightList = []
+        elif requestDeadline is not None or insightDeadline:
+            insightList = self.genInsightsWithDeadlines(insightTypes, requestDeadline, insightDeadline, projection)
+        elif executor == 'serial':
+            insightList = (self.genInsight(insightType, projection) for insightType in insightTypes)
+        else:
+            insightList = self.genInsightsParallel(insightTypes, executor, workers, projection)
+        return chain(prunedInsights, insightList)
+
+    def genInsights(self, insightTypes, executor=INSIGHT_EXECUTOR, workers=INSIGHT_WORKERS, projection=ALL_FIELDS,
+                    onInsight=None, budget=None, insightDeadline=None, cached=False, resultCache=None):
+
+        # The Budget Covers Everything From Here, Fingerprints and Prechecks Included
+        requestDeadline = time.monotonic() + budget if budget else None
+        if cached:
+            insightList = (self.genCachedInsight(insightType, projection)
+                           for insightType in insightTypes)
+        elif resultCache is not None:
+            def genMissing(missing, projection):
+                return self.genComputedInsights(missing, executor, workers, projection, requestDeadline, insightDeadline)
+            insightList = self.genReusedInsights(insightTypes, resultCache, genMissing, projection)
+        else:
+            insightList = self.genComputedInsights(
+                insightTypes, executor, workers, projection, requestDeadline, insightDeadline)
 
-        if insightType == 'ratingPriceCorr':
-            return genInsightRatingPriceCorr(self)
+        insights = {}
+        for insight in insightList:
+            if onInsight is not None:
+                onInsight(insight)
+            if insight.status == 'ok':
+                insights[insight.type] = insight.data
+        return insights
 
-        if insightType == 'ratingYearCorr':
-            return genInsightRatingYearCorr(self)
 
-        if insightType == 'playsWeightCorr':
-            return genInsightPlaysWeightCorr(self)
+def isInteger(value):
+    return isinstance(value, int) and not isinstance(value, bool) and -2 ** 63 <= value < 2 ** 63
 
-        if insightType == 'playsPlayTimeCorr':
-            return genInsightPlaysPlayTimeCorr(self)
 
-        if insightType == 'playsRecommendedPlayersCorr':
-            return genInsightPlaysRecommendedPlayersCorr(self)
+def isNumber(value):
+    return isInteger(value) or isinstance(value, float)
 
-        if insightType == 'playsMaxPlayersCorr':
-            return genInsightPlaysMaxPlayersCorr(self)
 
-        if insightType == 'playsPriceCorr':
-            return genInsightPlaysPriceCorr(self)
+def isValidItemField(field, value):
+    if field in COLUMN_FIELDS:
+        return value is None or isNumber(value)
+    if field == 'subtypeRatings':
+        return isinstance(value, list) and all(
+            isinstance(x, dict) and 'name' in x and
+            (x['name'] != 'boardgame' or ('value' in x and (x['value'] is None or isNumber(x['value']))))
+            for x in value)
+    if field in STAT_FIELDS:
+        return isinstance(value, list) and all(isinstance(x, dict) and isinstance(x.get('value'), str) for x in value)
+    if field == 'id':
+        try:
+            hash(value)
+        except TypeError:
+            return False
+    return True
 
-        if insightType == 'avgYear':
-            return genInsightAvgYear(self)
 
-        if insightType == 'mostCommonYears':
-            return genInsightMostCommonYears(self)
+# Delta Fields Are Checked Before Any Edit, a Bad Delta Must Not Leave Items and Columns Out of Step
+def validateItemFields(fields):
+    if not isinstance(fields, dict):
+        raise ValueError('Invalid item fields: {!r}'.format(fields))
+    for field, value in fields.items():
+        if not isValidItemField(field, value):
+            raise ValueError('Invalid {}: {!r}'.format(field, value))
+    return fields
 
-        if insightType == 'avgRecommendedPlayers':
-            return genInsightAvgRecommendedPlayers(self)
 
-        if insightType == 'avgMaxPlayers':
-            return genInsightAvgMaxPlayers(self)
+def registerInsight(insightType, build, inputs, **options):
+    spec = InsightSpec(insightType, build, inputs, **options)
+    INSIGHT_REGISTRY[insightType] = spec
+    INSIGHT_TYPES.append(insightType)
+    INSIGHT_INPUTS[insightType] = inputs
+    INSIGHT_COSTS[insightType] = spec.cost
+    return spec
 
-        if insightType == 'medianMaxPlayers':
-            return genInsightMedianMaxPlayers(self)
 
-        if insightType == 'avgMinPlayers':
-            return genInsightAvgMinPlayers(self)
+def orderByCost(insightTypes):
+    return sorted(insightTypes, key=lambda insightType: INSIGHT_COSTS[insightType])
 
-        if insightType == 'avgPrice':
-            return genInsightAvgPrice(self)
 
-        if insightType == 'medianPrice':
-            return genInsightMedianPrice(self)
+# Threads Only: Pickling the Collection to Worker Processes Costs More Than the Insights Themselves
+def getInsightPool(executor, workers):
+    if executor != 'thread':
+        raise ValueError('Unknown insight executor: {}'.format(executor))
+    return getExecutor(executor, workers)
 
-        if insightType == 'totalPrice':
-            return genInsightTotalPrice(self)
 
-        if insightType == 'top100':
-            return genInsightTop100(self)
+def resolveInsightTypes(insightTypesSpec):
+    insightTypes = []
+    for name in insightTypesSpec.split(','):
+        name = name.strip()
+        if name in INSIGHT_GROUPS:
+            insightTypes += INSIGHT_GROUPS[name]
+        elif name in INSIGHT_TYPES:
+            insightTypes.append(name)
+        else:
+            raise ValueError('Unknown insight type: {}'.format(name))
 
-        if insightType == 'kickstarter':
-            return genInsightKickstarter(self)
+    # Keep First Occurrence Order, Drop Repeats
+    return list(dict.fromkeys(insightTypes))
 
-        if insightType == 'mostCommonCategory':
-            return genInsightMostCommonCategory(self)
 
-        if insightType == 'mostCommonMechanic':
-            return genInsightMostCommonMechanic(self)
+# Item Fields Moved to the Shared itemsById Table in Normalized Responses
+ITEM_TABLE_FIELDS = ['name', 'image']
 
-        if insightType == 'mostCommonFamily':
-            return genInsightMostCommonFamily(self)
 
-        if insightType == 'mostCommonPublisher':
-            return genInsightMostCommonPublisher(self)
+def normalizeInsights(insights):
+    itemsById = {}
+    normalized = {}
+    for insightType, insightData in insights.items():
+        normalized[insightType] = {key: normalizeItems(value, itemsById) if key == 'items' else value
+                                   for key, value in insightData.items()}
+    return {'itemsById': itemsById, 'insights': normalized}
 
-        if insightType == 'mostCommonDesigner':
-            return genInsightMostCommonDesigner(self)
 
-        if insightType == 'mostCommonArtist':
-            return genInsightMostCommonArtist(self)
+def normalizeItems(items, itemsById):
 
-    def genAllInsights(self):
-        insightTypes = ['mostPlayed', 'mostTimePlayed', 'leastPlayed', 'leastTimePlayed', 'avgPlays', 'avgTimePlayed',
-                        'notPlayed', 'bestValue', 'worstValue', 'avgValue', 'maxWeight', 'minWeight', 'avgWeight', 'highestRated',
-                        'lowestRated', 'avgRating', 'highestBggRating', 'lowestBggRating', 'avgBggRating', 'highestAvgRating',
-                        'lowestAvgRating', 'avgAvgRating', 'avgRatingDiff', 'largestRatingDiff', 'largestPosRatingDiff',
-                        'largestNegRatingDiff', 'ratingAvgRatingCorr', 'ratingWeightCorr', 'ratingRecommendedPlayersCorr',
-                        'ratingPlayTimeCorr', 'ratingMaxPlayersCorr', 'ratingPlaysCorr', 'ratingTimePlayedCorr', 'ratingPriceCorr',
-                        'ratingYearCorr', 'playsWeightCorr', 'playsPlayTimeCorr', 'playsRecommendedPlayersCorr', 'playsMaxPlayersCorr',
-                        'playsPriceCorr', 'avgYear', 'mostCommonYears', 'avgRecommendedPlayers', 'avgMaxPlayers', 'medianMaxPlayers', 'avgMinPlayers',
-                        'avgPrice', 'medianPrice', 'totalPrice', 'top100', 'kickstarter', 'mostCommonCategory', 'mostCommonMechanic', 'mostCommonFamily',
-                        'mostCommonPublisher', 'mostCommonDesigner', 'mostCommonArtist']
-        insights = {}
-        for insightType in insightTypes:
-            insight = self.genInsight(insightType)
-            if insight.status == 'ok':
-                insights[insightType] = insight.data
-        return insights
+    # Parallel Arrays: Item Ids Plus One Array per Per-Insight Field
+    normalizedItems = {'ids': [x['id'] for x in items]}
+    for item in items:
+        itemId = str(item['id'])
+        if itemId not in itemsById:
+            itemsById[itemId] = {key: item[key]
+                                 for key in ITEM_TABLE_FIELDS if key in item}
+    fields = [key for key in (items[0] if items != [] else {})
+              if key != 'id' and key not in ITEM_TABLE_FIELDS]
+    for field in fields:
+        normalizedItems[field] = [x.get(field) for x in items]
+    return normalizedItems
 
 
 def genInsightMostPlayed(collection):
@@ -957,7 +1049,7 @@ def genInsightMostPlayed(collection):
     else:
         insightData = {
             'nPlays': mostPlayedItems[0].numPlays,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -984,7 +1076,7 @@ def genInsightMostTimePlayed(collection):
     else:
         insightData = {
             'timePlayed': mostPlayedItems[0].numPlays * mostPlayedItems[0].playTime,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1013,7 +1105,7 @@ def genInsightLeastPlayed(collection):
     else:
         insightData = {
             'nPlays': leastPlayedItems[0].numPlays,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1041,7 +1133,7 @@ def genInsightLeastTimePlayed(collection):
     else:
         insightData = {
             'timePlayed': leastPlayedItems[0].numPlays * leastPlayedItems[0].playTime,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1068,7 +1160,7 @@ def genInsightAvgPlays(collection):
     else:
         insightData = {
             'avgPlays': collection.getAvgPlays(),
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1094,7 +1186,7 @@ def genInsightAvgTimePlayed(collection):
     else:
         insightData = {
             'avgTimePlayed': collection.getAvgTimePlayed(),
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1130,7 +1222,7 @@ def genInsightNotPlayed(collection):
         insightData = {
             'nNotPlayed': len(notPlayedItems),
             'prctNotPlayed': round(len(notPlayedItems)/len(collection.items), 2),
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image} for x in notPlayedItems]
@@ -1149,7 +1241,7 @@ def genInsightBestValue(collection):
         bestValueItem = collection.getBestValueItem()
         insightData = {
             'bestValue': round(collection.getBestValue(), 2),
-            'items':  [{
+            'items': lambda: [{
                 'id': bestValueItem.id,
                 'name': bestValueItem.name,
                 'image': bestValueItem.image,
@@ -1171,7 +1263,7 @@ def genInsightWorstValue(collection):
 
         insightData = {
             'worstValue': round(collection.getWorstValue(), 2),
-            'items':  [{
+            'items': lambda: [{
                 'id': worstValueItem.id,
                 'name': worstValueItem.name,
                 'image': worstValueItem.image,
@@ -1195,7 +1287,7 @@ def genInsightAvgValue(collection):
         avgValue = collection.getAvgValue()
         insightData = {
             'avgValue': round(avgValue, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1216,7 +1308,7 @@ def genInsightMaxWeight(collection):
         maxWeightItem = collection.getMaxWeightItem()
         insightData = {
             'maxWeight': round(maxWeightItem.averageWeight, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': maxWeightItem.id,
                 'name': maxWeightItem.name,
                 'image': maxWeightItem.image,
@@ -1235,7 +1327,7 @@ def genInsightMinWeight(collection):
         minWeightItem = collection.getMinWeightItem()
         insightData = {
             'minWeight': round(minWeightItem.averageWeight, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': minWeightItem.id,
                 'name': minWeightItem.name,
                 'image': minWeightItem.image,
@@ -1254,7 +1346,7 @@ def genInsightAvgWeight(collection):
         avgWeight = collection.getAvgWeight()
         insightData = {
             'avgWeight': round(avgWeight, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1273,7 +1365,7 @@ def genInsightHighestRated(collection):
         highestRatedItems = collection.getHighestRatedItems()
         insightData = {
             'highestUserRating': highestRatedItems[0].userRating,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1292,7 +1384,7 @@ def genInsightLowestRated(collection):
         lowestRatedItems = collection.getLowestRatedItems()
         insightData = {
             'lowestUserRating': lowestRatedItems[0].userRating,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1311,7 +1403,7 @@ def genInsightAvgRating(collection):
         avgRating = collection.getAvgRating()
         insightData = {
             'avgUserRating': round(avgRating, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1330,7 +1422,7 @@ def genInsightHighestBggRating(collection):
         highestBggRatingItem = collection.getHighestBggRating()
         insightData = {
             'highestBggRating': round(highestBggRatingItem.bayesAverageRating, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': highestBggRatingItem.id,
                 'name': highestBggRatingItem.name,
                 'image': highestBggRatingItem.image,
@@ -1349,7 +1441,7 @@ def genInsightLowestBggRating(collection):
         lowestBggRatingItem = collection.getLowestBggRating()
         insightData = {
             'lowestBggRating': round(lowestBggRatingItem.bayesAverageRating, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': lowestBggRatingItem.id,
                 'name': lowestBggRatingItem.name,
                 'image': lowestBggRatingItem.image,
@@ -1369,7 +1461,7 @@ def genInsightAvgBggRating(collection):
         avgBggRating = collection.getAvgBggRating()
         insightData = {
             'avgBggRating': round(avgBggRating, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1389,7 +1481,7 @@ def genInsightHighestAvgRating(collection):
         highestAvgRatingItem = collection.getHighestAvgRating()
         insightData = {
             'highestAvgRating': round(highestAvgRatingItem.averageRating, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': highestAvgRatingItem.id,
                 'name': highestAvgRatingItem.name,
                 'image': highestAvgRatingItem.image,
@@ -1409,7 +1501,7 @@ def genInsightLowestAvgRating(collection):
         lowestAvgRatingItem = collection.getLowestAvgRating()
         insightData = {
             'lowestAvgRating': round(lowestAvgRatingItem.averageRating, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': lowestAvgRatingItem.id,
                 'name': lowestAvgRatingItem.name,
                 'image': lowestAvgRatingItem.image,
@@ -1429,7 +1521,7 @@ def genInsightAvgAvgRating(collection):
         avgAvgRating = collection.getAvgAvgRating()
         insightData = {
             'avgAvgRating': round(avgAvgRating, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1448,7 +1540,7 @@ def genInsightAvgRatingDiff(collection):
         avgRatingDiff = collection.getAvgRatingDiff()
         insightData = {
             'avgRatingDiff': round(avgRatingDiff, 2),
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1468,7 +1560,7 @@ def genInsightLargestRatingDiff(collection):
         largestDiffItem = collection.getLargestRatingDiffItem()
         insightData = {
             'largestRatingDiff': largestDiffItem.userRating - largestDiffItem.averageRating,
-            'items': [{
+            'items': lambda: [{
                 'id': largestDiffItem.id,
                 'name': largestDiffItem.name,
                 'image': largestDiffItem.image,
@@ -1494,7 +1586,7 @@ def genInsightLargestPosRatingDiff(collection):
         else:
             insightData = {
                 'largestPosRatingDiff': largestDiffItem.userRating - largestDiffItem.averageRating,
-                'items': [{
+                'items': lambda: [{
                     'id': largestDiffItem.id,
                     'name': largestDiffItem.name,
                     'image': largestDiffItem.image,
@@ -1518,7 +1610,7 @@ def genInsightLargestNegRatingDiff(collection):
         else:
             insightData = {
                 'largestNegRatingDiff': largestDiffItem.averageRating - largestDiffItem.userRating,
-                'items': [{
+                'items': lambda: [{
                     'id': largestDiffItem.id,
                     'name': largestDiffItem.name,
                     'image': largestDiffItem.image,
@@ -1531,13 +1623,8 @@ def genInsightLargestNegRatingDiff(collection):
 
 def genInsightRatingAvgRatingCorr(collection):
     insightType = 'ratingAvgRatingCorr'
-    items = [{
-        'id': x.id,
-        'name': x.name,
-        'image': x.image,
-        'userRating':  x.userRating,
-        'avgRating': x.averageRating} for x in collection.items if x.userRating is not None and x.averageRating is not None]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.userRating is not None and x.averageRating is not None]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyUserRatings():
@@ -1549,9 +1636,14 @@ def genInsightRatingAvgRatingCorr(collection):
     else:
         ratingAvgRatingCorr = collection.getRatingAvgRatingCorr()
         insightData = {
-            'pearsonr': ratingAvgRatingCorr['pearsonr'][0],
-            'spearmanr': ratingAvgRatingCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': ratingAvgRatingCorr['pearsonr'],
+            'spearmanr': ratingAvgRatingCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'userRating': x.userRating,
+                'avgRating': x.averageRating} for x in corrItems]
         }
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
@@ -1559,13 +1651,8 @@ def genInsightRatingAvgRatingCorr(collection):
 
 def genInsightRatingWeightCorr(collection):
     insightType = 'ratingWeightCorr'
-    items = [{
-        'id': x.id,
-        'name': x.name,
-        'image': x.image,
-        'userRating':  x.userRating,
-        'weight': x.averageWeight} for x in collection.items if x.userRating is not None and x.averageWeight is not None]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.userRating is not None and x.averageWeight is not None]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyUserRatings():
@@ -1577,25 +1664,25 @@ def genInsightRatingWeightCorr(collection):
     else:
         ratingWeightCorr = collection.getRatingWeightCorr()
         insightData = {
-            'pearsonr': ratingWeightCorr['pearsonr'][0],
-            'spearmanr': ratingWeightCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': ratingWeightCorr['pearsonr'],
+            'spearmanr': ratingWeightCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'userRating': x.userRating,
+                'weight': x.averageWeight} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['weight'] for e in insightData['items']], [
-            e['userRating'] for e in insightData['items']], 1, 4.5)
+        insightData['trend'] = lambda: getBestCurveFit([x.averageWeight for x in corrItems], [
+            x.userRating for x in corrItems], 1, 4.5)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightRatingRecommendedPlayersCorr(collection):
     insightType = 'ratingRecommendedPlayersCorr'
-    items = [{
-        'id': x.id,
-        'name': x.name,
-        'image': x.image,
-        'userRating': x.userRating,
-        'recommendedPlayers': x.recommendedPlayers} for x in collection.items if x.userRating is not None]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.userRating is not None]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyUserRatings():
@@ -1607,25 +1694,25 @@ def genInsightRatingRecommendedPlayersCorr(collection):
     else:
         ratingRecommendedPlayersCorr = collection.getRatingRecommendedPlayersCorr()
         insightData = {
-            'pearsonr': ratingRecommendedPlayersCorr['pearsonr'][0],
-            'spearmanr': ratingRecommendedPlayersCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': ratingRecommendedPlayersCorr['pearsonr'],
+            'spearmanr': ratingRecommendedPlayersCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'userRating': x.userRating,
+                'recommendedPlayers': x.recommendedPlayers} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['recommendedPlayers'] for e in insightData['items']], [
-            e['userRating'] for e in insightData['items']], 1, 7)
+        insightData['trend'] = lambda: getBestCurveFit([x.recommendedPlayers for x in corrItems], [
+            x.userRating for x in corrItems], 1, 7)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightRatingMaxPlayersCorr(collection):
     insightType = 'ratingMaxPlayersCorr'
-    items = [{
-        'id': x.id,
-        'name': x.name,
-        'image': x.image,
-        'userRating': x.userRating,
-        'maxPlayers': x.maxPlayers} for x in collection.items if x.userRating is not None]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.userRating is not None]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyUserRatings():
@@ -1637,25 +1724,25 @@ def genInsightRatingMaxPlayersCorr(collection):
     else:
         ratingMaxPlayersCorr = collection.getRatingMaxPlayersCorr()
         insightData = {
-            'pearsonr': ratingMaxPlayersCorr['pearsonr'][0],
-            'spearmanr': ratingMaxPlayersCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': ratingMaxPlayersCorr['pearsonr'],
+            'spearmanr': ratingMaxPlayersCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'userRating': x.userRating,
+                'maxPlayers': x.maxPlayers} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['maxPlayers'] for e in insightData['items']], [
-            e['userRating'] for e in insightData['items']], 1, 7)
+        insightData['trend'] = lambda: getBestCurveFit([x.maxPlayers for x in corrItems], [
+            x.userRating for x in corrItems], 1, 7)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightRatingPlayTimeCorr(collection):
     insightType = 'ratingPlayTimeCorr'
-    items = [{
-        'id': x.id,
-        'name': x.name,
-        'image': x.image,
-        'userRating': x.userRating,
-        'playTime': x.playTime} for x in collection.items if x.userRating is not None]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.userRating is not None]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyUserRatings():
@@ -1667,25 +1754,25 @@ def genInsightRatingPlayTimeCorr(collection):
     else:
         ratingPlayTimeCorr = collection.getRatingPlayTimeCorr()
         insightData = {
-            'pearsonr': ratingPlayTimeCorr['pearsonr'][0],
-            'spearmanr': ratingPlayTimeCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': ratingPlayTimeCorr['pearsonr'],
+            'spearmanr': ratingPlayTimeCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'userRating': x.userRating,
+                'playTime': x.playTime} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['playTime'] for e in insightData['items']], [
-            e['userRating'] for e in insightData['items']], 10, 300)
+        insightData['trend'] = lambda: getBestCurveFit([x.playTime for x in corrItems], [
+            x.userRating for x in corrItems], 10, 300)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightRatingPlaysCorr(collection):
     insightType = 'ratingPlaysCorr'
-    items = [{
-        'id': x.id,
-        'name': x.name,
-        'image': x.image,
-        'userRating': x.userRating,
-        'nPlays': x.numPlays} for x in collection.items if x.userRating is not None and x.numPlays != 0]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.userRating is not None and x.numPlays != 0]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyRecordedPlays():
@@ -1700,27 +1787,25 @@ def genInsightRatingPlaysCorr(collection):
     else:
         ratingPlaysCorr = collection.getRatingPlaysCorr()
         insightData = {
-            'pearsonr': ratingPlaysCorr['pearsonr'][0],
-            'spearmanr': ratingPlaysCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': ratingPlaysCorr['pearsonr'],
+            'spearmanr': ratingPlaysCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'userRating': x.userRating,
+                'nPlays': x.numPlays} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['nPlays'] for e in insightData['items']], [
-            e['userRating'] for e in insightData['items']], 0, 100)
+        insightData['trend'] = lambda: getBestCurveFit([x.numPlays for x in corrItems], [
+            x.userRating for x in corrItems], 0, 100)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightRatingTimePlayedCorr(collection):
     insightType = 'ratingTimePlayedCorr'
-    items = [{
-        'id': x.id,
-        'name': x.name,
-        'image': x.image,
-        'userRating': x.userRating,
-        'nPlays': x.numPlays,
-        'playTime': x.playTime,
-        'timePlayed': round((x.numPlays * x.playTime)/60, 2)} for x in collection.items if x.userRating is not None and x.numPlays != 0 and x.playTime != 0]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.userRating is not None and x.numPlays != 0 and x.playTime != 0]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyRecordedPlays():
@@ -1735,12 +1820,19 @@ def genInsightRatingTimePlayedCorr(collection):
     else:
         ratingTimePlayedCorr = collection.getRatingTimePlayedCorr()
         insightData = {
-            'pearsonr': ratingTimePlayedCorr['pearsonr'][0],
-            'spearmanr': ratingTimePlayedCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': ratingTimePlayedCorr['pearsonr'],
+            'spearmanr': ratingTimePlayedCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'userRating': x.userRating,
+                'nPlays': x.numPlays,
+                'playTime': x.playTime,
+                'timePlayed': round((x.numPlays * x.playTime)/60, 2)} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['timePlayed'] for e in insightData['items']], [
-            e['userRating'] for e in insightData['items']], 0, 100)
+        insightData['trend'] = lambda: getBestCurveFit([round((x.numPlays * x.playTime)/60, 2) for x in corrItems], [
+            x.userRating for x in corrItems], 0, 100)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
@@ -1748,13 +1840,8 @@ def genInsightRatingTimePlayedCorr(collection):
 def genInsightRatingPriceCorr(collection):
     insightType = 'ratingPriceCorr'
 
-    items = [{
-                'id': x.id,
-                'name': x.name,
-                'image': x.image,
-                'userRating': x.userRating,
-                'price': x.medianPrice} for x in collection.items if x.userRating is not None and x.medianPrice is not None]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.userRating is not None and x.medianPrice is not None]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyUserRatings():
@@ -1766,25 +1853,25 @@ def genInsightRatingPriceCorr(collection):
     else:
         ratingPriceCorr = collection.getRatingPriceCorr()
         insightData = {
-            'pearsonr': ratingPriceCorr['pearsonr'][0],
-            'spearmanr': ratingPriceCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': ratingPriceCorr['pearsonr'],
+            'spearmanr': ratingPriceCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'userRating': x.userRating,
+                'price': x.medianPrice} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['price'] for e in insightData['items']], [
-            e['userRating'] for e in insightData['items']], 10, 300)
+        insightData['trend'] = lambda: getBestCurveFit([x.medianPrice for x in corrItems], [
+            x.userRating for x in corrItems], 10, 300)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightRatingYearCorr(collection):
     insightType = 'ratingYearCorr'
-    items = [{
-                'id': x.id,
-                'name': x.name,
-                'image': x.image,
-                'userRating': x.userRating,
-                'yearPublished': x.yearPublished} for x in collection.items if x.userRating is not None and x.yearPublished is not None]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.userRating is not None and x.yearPublished is not None]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyUserRatings():
@@ -1796,25 +1883,25 @@ def genInsightRatingYearCorr(collection):
     else:
         ratingYearCorr = collection.getRatingYearCorr()
         insightData = {
-            'pearsonr': ratingYearCorr['pearsonr'][0],
-            'spearmanr': ratingYearCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': ratingYearCorr['pearsonr'],
+            'spearmanr': ratingYearCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'userRating': x.userRating,
+                'yearPublished': x.yearPublished} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['yearPublished'] for e in insightData['items']], [
-            e['userRating'] for e in insightData['items']], 1980, 2020)
+        insightData['trend'] = lambda: getBestCurveFit([x.yearPublished for x in corrItems], [
+            x.userRating for x in corrItems], 1980, 2020)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightPlaysWeightCorr(collection):
     insightType = 'playsWeightCorr'
-    items = [{
-                'id': x.id,
-                'name': x.name,
-                'image': x.image,
-                'nPlays': x.numPlays,
-                'weight': round(x.averageWeight, 1)} for x in collection.items if x.numPlays != 0 and x.averageWeight is not None]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.numPlays != 0 and x.averageWeight is not None]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyRecordedPlays():
@@ -1826,25 +1913,25 @@ def genInsightPlaysWeightCorr(collection):
     else:
         playsWeightCorr = collection.getPlaysWeightCorr()
         insightData = {
-            'pearsonr': playsWeightCorr['pearsonr'][0],
-            'spearmanr': playsWeightCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': playsWeightCorr['pearsonr'],
+            'spearmanr': playsWeightCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'nPlays': x.numPlays,
+                'weight': round(x.averageWeight, 1)} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['weight'] for e in insightData['items']], [
-            e['nPlays'] for e in insightData['items']], 1, 4.5)
+        insightData['trend'] = lambda: getBestCurveFit([round(x.averageWeight, 1) for x in corrItems], [
+            x.numPlays for x in corrItems], 1, 4.5)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightPlaysPlayTimeCorr(collection):
     insightType = 'playsPlayTimeCorr'
-    items = [{
-                'id': x.id,
-                'name': x.name,
-                'image': x.image,
-                'nPlays': x.numPlays,
-                'playTime': x.playTime} for x in collection.items if x.numPlays != 0]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.numPlays != 0]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyRecordedPlays():
@@ -1856,25 +1943,25 @@ def genInsightPlaysPlayTimeCorr(collection):
     else:
         playsPlayTimeCorr = collection.getPlaysPlayTimeCorr()
         insightData = {
-            'pearsonr': playsPlayTimeCorr['pearsonr'][0],
-            'spearmanr': playsPlayTimeCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': playsPlayTimeCorr['pearsonr'],
+            'spearmanr': playsPlayTimeCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'nPlays': x.numPlays,
+                'playTime': x.playTime} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['playTime'] for e in insightData['items']], [
-            e['nPlays'] for e in insightData['items']], 10, 300)
+        insightData['trend'] = lambda: getBestCurveFit([x.playTime for x in corrItems], [
+            x.numPlays for x in corrItems], 10, 300)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightPlaysRecommendedPlayersCorr(collection):
     insightType = 'playsRecommendedPlayersCorr'
-    items = [{
-                'id': x.id,
-                'name': x.name,
-                'image': x.image,
-                'nPlays': x.numPlays,
-                'recommendedPlayers': x.recommendedPlayers} for x in collection.items if x.numPlays != 0]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.numPlays != 0]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyRecordedPlays():
@@ -1886,25 +1973,25 @@ def genInsightPlaysRecommendedPlayersCorr(collection):
     else:
         playsRecommendedPlayersCorr = collection.getPlaysRecommendedPlayersCorr()
         insightData = {
-            'pearsonr': playsRecommendedPlayersCorr['pearsonr'][0],
-            'spearmanr': playsRecommendedPlayersCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': playsRecommendedPlayersCorr['pearsonr'],
+            'spearmanr': playsRecommendedPlayersCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'nPlays': x.numPlays,
+                'recommendedPlayers': x.recommendedPlayers} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['recommendedPlayers'] for e in insightData['items']], [
-            e['nPlays'] for e in insightData['items']], 1, 7)
+        insightData['trend'] = lambda: getBestCurveFit([x.recommendedPlayers for x in corrItems], [
+            x.numPlays for x in corrItems], 1, 7)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightPlaysMaxPlayersCorr(collection):
     insightType = 'playsMaxPlayersCorr'
-    items = [{
-                'id': x.id,
-                'name': x.name,
-                'image': x.image,
-                'nPlays': x.numPlays,
-                'maxPlayers': x.maxPlayers} for x in collection.items if x.numPlays != 0]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.numPlays != 0]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyRecordedPlays():
@@ -1916,25 +2003,25 @@ def genInsightPlaysMaxPlayersCorr(collection):
     else:
         playsMaxPlayersCorr = collection.getPlaysMaxPlayersCorr()
         insightData = {
-            'pearsonr': playsMaxPlayersCorr['pearsonr'][0],
-            'spearmanr': playsMaxPlayersCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': playsMaxPlayersCorr['pearsonr'],
+            'spearmanr': playsMaxPlayersCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'nPlays': x.numPlays,
+                'maxPlayers': x.maxPlayers} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['maxPlayers'] for e in insightData['items']], [
-            e['nPlays'] for e in insightData['items']], 1, 7)
+        insightData['trend'] = lambda: getBestCurveFit([x.maxPlayers for x in corrItems], [
+            x.numPlays for x in corrItems], 1, 7)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
 
 def genInsightPlaysPriceCorr(collection):
     insightType = 'playsPriceCorr'
-    items = [{
-                'id': x.id,
-                'name': x.name,
-                'image': x.image,
-                'nPlays': x.numPlays,
-                'price': x.medianPrice} for x in collection.items if x.medianPrice is not None and x.numPlays != 0]
-    if len(items) < 30:
+    corrItems = [x for x in collection.items if x.medianPrice is not None and x.numPlays != 0]
+    if len(corrItems) < 30:
         insightData = {}
         insightStatus = 'Less than 30 boardgames to consider.'
     elif not collection.checkIfAnyRecordedPlays():
@@ -1946,12 +2033,17 @@ def genInsightPlaysPriceCorr(collection):
     else:
         playsPriceCorr = collection.getPlaysPriceCorr()
         insightData = {
-            'pearsonr': playsPriceCorr['pearsonr'][0],
-            'spearmanr': playsPriceCorr['spearmanr'][0],
-            'items': items
+            'pearsonr': playsPriceCorr['pearsonr'],
+            'spearmanr': playsPriceCorr['spearmanr'],
+            'items': lambda: [{
+                'id': x.id,
+                'name': x.name,
+                'image': x.image,
+                'nPlays': x.numPlays,
+                'price': x.medianPrice} for x in corrItems]
         }
-        insightData['trend'] = getBestCurveFit([e['price'] for e in insightData['items']], [
-            e['nPlays'] for e in insightData['items']], 10, 300)
+        insightData['trend'] = lambda: getBestCurveFit([x.medianPrice for x in corrItems], [
+            x.numPlays for x in corrItems], 10, 300)
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
 
@@ -1966,7 +2058,7 @@ def genInsightAvgYear(collection):
         avgYear = collection.getAvgYear()
         insightData = {
             'avgYear': avgYear,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -1986,17 +2078,19 @@ def genInsightMostCommonYears(collection):
         yearOccurrencesKeys = list(yearOccurrences.keys())
         yearOccurrencesValues = list(yearOccurrences.values())
         maxOccurrences = max(yearOccurrencesValues)
-        maxOccurrencesIndexes = [i for i, x in enumerate(
-            yearOccurrencesValues) if x == max(yearOccurrencesValues)]
+        maxOccurrencesIndexes = getExtremeIndexes(yearOccurrencesValues)
+        mostCommonYears = [yearOccurrencesKeys[index]
+                           for index in maxOccurrencesIndexes]
+        mostCommonYearsSet = set(mostCommonYears)
         insightData = {
-            'mostCommonYears': [yearOccurrencesKeys[index] for index in maxOccurrencesIndexes],
+            'mostCommonYears': mostCommonYears,
             'mostCommonYearOccurrences': maxOccurrences,
             'yearOccurences': yearOccurrences,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
-                'yearPublished': x.yearPublished} for x in collection.items if x.yearPublished in [yearOccurrencesKeys[index] for index in maxOccurrencesIndexes]]
+                'yearPublished': x.yearPublished} for x in collection.items if x.yearPublished in mostCommonYearsSet]
         }
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
@@ -2012,7 +2106,7 @@ def genInsightAvgRecommendedPlayers(collection):
         avgRecommendedPlayers = collection.getAvgRecommendedPlayers()
         insightData = {
             'avgRecommendedPlayers': avgRecommendedPlayers,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -2032,7 +2126,7 @@ def genInsightAvgMaxPlayers(collection):
         avgMaxPlayers = collection.getAvgMaxPlayers()
         insightData = {
             'avgMaxPlayers': avgMaxPlayers,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -2052,7 +2146,7 @@ def genInsightMedianMaxPlayers(collection):
         medianMaxPlayers = collection.getMedianMaxPlayers()
         insightData = {
             'medianMaxPlayers': medianMaxPlayers,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -2072,7 +2166,7 @@ def genInsightAvgMinPlayers(collection):
         avgMinPlayers = collection.getAvgMinPlayers()
         insightData = {
             'avgMinPlayers': avgMinPlayers,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -2092,7 +2186,7 @@ def genInsightAvgPrice(collection):
         avgPrice = collection.getAvgPrice()
         insightData = {
             'avgPrice': avgPrice,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -2112,7 +2206,7 @@ def genInsightMedianPrice(collection):
         medianPrice = collection.getMedianPrice()
         insightData = {
             'medianPrice': medianPrice,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -2132,7 +2226,7 @@ def genInsightTotalPrice(collection):
         totalPrice = collection.getTotalPrice()
         insightData = {
             'totalPrice': totalPrice,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -2156,7 +2250,7 @@ def genInsightTop100(collection):
         insightData = {
             'nTop100': nTop100,
             'prctTop100': prctTop100,
-            'items': [{
+            'items': lambda: [{
                 'id': x.id,
                 'name': x.name,
                 'image': x.image,
@@ -2169,15 +2263,13 @@ def genInsightTop100(collection):
 def genInsightKickstarter(collection):
     insightType = 'kickstarter'
 
-    kickstarterGames = collection.getStatGames('families', 'kickstarter')
-
-    nKickstarter = len(kickstarterGames)
+    nKickstarter = len(collection.taxonomy.getItemIndexes('families', 'kickstarter'))
     prctKickstarter = nKickstarter / len(collection.items)
 
     insightData = {
         'nKickstarter': nKickstarter,
         'prctKickstarter': round(prctKickstarter, 2),
-        'items': kickstarterGames
+        'items': lambda: collection.getStatGames('families', 'kickstarter')
     }
     insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
@@ -2193,21 +2285,12 @@ def genInsightMostCommonCategory(collection):
         insightData = {}
         insightStatus = 'No category matching 2 or more boardgames.'
     else:
-        mostCommonCategoryGames = []
-        for categoryEntry in mostCommonCategory:
-            mostCommonCategoryGamesAux = collection.getStatGames(
-                'categories', categoryEntry)
-            for game in mostCommonCategoryGamesAux:
-                mostCommonCategoryGames.append(game)
-        mostCommonCategoryGames = list(
-            {v['id']: v for v in mostCommonCategoryGames}.values())
-
         insightData = {
             'mostCommonCategory': mostCommonCategory,
             'nMostCommonCategory': categoryHist[mostCommonCategory[0]],
             'prctMostCommonCategory': categoryHist[mostCommonCategory[0]] / len(collection.items),
             'categoryHist': categoryHist,
-            'items': mostCommonCategoryGames
+            'items': lambda: collection.getStatEntriesGames('categories', mostCommonCategory)
         }
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
@@ -2223,21 +2306,12 @@ def genInsightMostCommonMechanic(collection):
         insightData = {}
         insightStatus = 'No mechanic matching 2 or more boardgames.'
     else:
-        mostCommonMechanicGames = []
-        for mechanicEntry in mostCommonMechanic:
-            mostCommonMechanicGamesAux = collection.getStatGames(
-                'mechanics', mechanicEntry)
-            for game in mostCommonMechanicGamesAux:
-                mostCommonMechanicGames.append(game)
-        mostCommonMechanicGames = list(
-            {v['id']: v for v in mostCommonMechanicGames}.values())
-
         insightData = {
             'mostCommonMechanic': mostCommonMechanic,
             'nMostCommonMechanic': mechanicHist[mostCommonMechanic[0]],
             'prctMostCommonMechanic': mechanicHist[mostCommonMechanic[0]] / len(collection.items),
             'mechanicHist': mechanicHist,
-            'items': mostCommonMechanicGames
+            'items': lambda: collection.getStatEntriesGames('mechanics', mostCommonMechanic)
         }
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
@@ -2253,21 +2327,12 @@ def genInsightMostCommonFamily(collection):
         insightData = {}
         insightStatus = 'No family matching 2 or more boardgames.'
     else:
-        mostCommonFamilyGames = []
-        for familyEntry in mostCommonFamily:
-            mostCommonFamilyGamesAux = collection.getStatGames(
-                'families', familyEntry)
-            for game in mostCommonFamilyGamesAux:
-                mostCommonFamilyGames.append(game)
-        mostCommonFamilyGames = list(
-            {v['id']: v for v in mostCommonFamilyGames}.values())
-
         insightData = {
             'mostCommonFamily': mostCommonFamily,
             'nMostCommonFamily': familyHist[mostCommonFamily[0]],
             'prctMostCommonFamily': familyHist[mostCommonFamily[0]] / len(collection.items),
             'familyHist': familyHist,
-            'items': mostCommonFamilyGames
+            'items': lambda: collection.getStatEntriesGames('families', mostCommonFamily)
         }
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
@@ -2283,21 +2348,12 @@ def genInsightMostCommonDesigner(collection):
         insightData = {}
         insightStatus = 'No designer matching 2 or more boardgames.'
     else:
-        mostCommonDesignerGames = []
-        for designerEntry in mostCommonDesigner:
-            mostCommonDesignerGamesAux = collection.getStatGames(
-                'designers', designerEntry)
-            for game in mostCommonDesignerGamesAux:
-                mostCommonDesignerGames.append(game)
-        mostCommonDesignerGames = list(
-            {v['id']: v for v in mostCommonDesignerGames}.values())
-
         insightData = {
             'mostCommonDesigner': mostCommonDesigner,
             'nMostCommonDesigner': designerHist[mostCommonDesigner[0]],
             'prctMostCommonDesigner': designerHist[mostCommonDesigner[0]] / len(collection.items),
             'designerHist': designerHist,
-            'items': mostCommonDesignerGames
+            'items': lambda: collection.getStatEntriesGames('designers', mostCommonDesigner)
         }
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
@@ -2313,21 +2369,12 @@ def genInsightMostCommonPublisher(collection):
         insightData = {}
         insightStatus = 'No publisher matching 2 or more boardgames.'
     else:
-        mostCommonPublisherGames = []
-        for designerEntry in mostCommonPublisher:
-            mostCommonPublisherGamesAux = collection.getStatGames(
-                'publishers', designerEntry)
-            for game in mostCommonPublisherGamesAux:
-                mostCommonPublisherGames.append(game)
-        mostCommonPublisherGames = list(
-            {v['id']: v for v in mostCommonPublisherGames}.values())
-
         insightData = {
             'mostCommonPublisher': mostCommonPublisher,
             'nMostCommonPublisher': publisherHist[mostCommonPublisher[0]],
             'prctMostCommonPublisher': publisherHist[mostCommonPublisher[0]] / len(collection.items),
             'publisherHist': publisherHist,
-            'items': mostCommonPublisherGames
+            'items': lambda: collection.getStatEntriesGames('publishers', mostCommonPublisher)
         }
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
@@ -2343,21 +2390,116 @@ def genInsightMostCommonArtist(collection):
         insightData = {}
         insightStatus = 'No artist matching 2 or more boardgames.'
     else:
-        mostCommonArtistGames = []
-        for designerEntry in mostCommonArtist:
-            mostCommonArtistGamesAux = collection.getStatGames(
-                'artists', designerEntry)
-            for game in mostCommonArtistGamesAux:
-                mostCommonArtistGames.append(game)
-        mostCommonArtistGames = list(
-            {v['id']: v for v in mostCommonArtistGames}.values())
-
+        nMostCommonArtist = collection.countStatEntriesGames('artists', mostCommonArtist)
         insightData = {
             'mostCommonArtist': mostCommonArtist,
-            'nMostCommonArtist': len(mostCommonArtistGames),
-            'prctMostCommonArtist': len(mostCommonArtistGames) / len(collection.items),
+            'nMostCommonArtist': nMostCommonArtist,
+            'prctMostCommonArtist': nMostCommonArtist / len(collection.items),
             'artistHist': artistHist,
-            'items': mostCommonArtistGames
+            'items': lambda: collection.getStatEntriesGames('artists', mostCommonArtist)
         }
         insightStatus = 'ok'
     return Insight(insightType, insightData, insightStatus)
+
+
+# Insight Registry: Name, Builder, Inputs, Prechecks and Cost, in Response Order
+registerInsight('mostPlayed', genInsightMostPlayed, PLAYS_INPUTS, prechecks=PLAYS_PRECHECKS, errorMessages=True)
+registerInsight('mostTimePlayed', genInsightMostTimePlayed, TIME_PLAYED_INPUTS, prechecks=PLAYS_PRECHECKS,
+                errorMessages=True)
+registerInsight('leastPlayed', genInsightLeastPlayed, PLAYS_INPUTS, prechecks=PLAYS_PRECHECKS, errorMessages=True)
+registerInsight('leastTimePlayed', genInsightLeastTimePlayed, TIME_PLAYED_INPUTS, prechecks=PLAYS_PRECHECKS,
+                errorMessages=True)
+registerInsight('avgPlays', genInsightAvgPlays, PLAYS_INPUTS, prechecks=PLAYS_PRECHECKS, errorMessages=True)
+registerInsight('avgTimePlayed', genInsightAvgTimePlayed, TIME_PLAYED_INPUTS, prechecks=PLAYS_PRECHECKS,
+                errorMessages=True)
+registerInsight('notPlayed', genInsightNotPlayed, PLAYS_INPUTS + ['totalPlays'], prechecks=RECENT_PLAYS_PRECHECKS,
+                errorMessages=True)
+registerInsight('bestValue', genInsightBestValue, VALUE_INPUTS, prechecks=PLAYED_PRECHECKS)
+registerInsight('worstValue', genInsightWorstValue, VALUE_INPUTS, prechecks=PLAYED_PRECHECKS)
+registerInsight('avgValue', genInsightAvgValue, VALUE_INPUTS, prechecks=PLAYED_PRECHECKS)
+registerInsight('maxWeight', genInsightMaxWeight, ['averageWeight.max'], prechecks=[('weights', 'No weights.')])
+registerInsight('minWeight', genInsightMinWeight, ['averageWeight.min'], prechecks=[('weights', 'No weights.')])
+registerInsight('avgWeight', genInsightAvgWeight, ['averageWeight'], prechecks=[('weights', 'No weights.')])
+registerInsight('highestRated', genInsightHighestRated, ['userRating.max'], prechecks=RATED_PRECHECKS)
+registerInsight('lowestRated', genInsightLowestRated, ['userRating.min'], prechecks=RATED_PRECHECKS)
+registerInsight('avgRating', genInsightAvgRating, ['userRating'], prechecks=RATED_PRECHECKS)
+registerInsight('highestBggRating', genInsightHighestBggRating, ['bayesAverageRating.max'],
+                prechecks=[('bggRatings', 'No rated items.')])
+registerInsight('lowestBggRating', genInsightLowestBggRating, ['bayesAverageRating'],
+                prechecks=[('bggRatings', 'No rated items.')])
+registerInsight('avgBggRating', genInsightAvgBggRating, ['bayesAverageRating', 'items'],
+                prechecks=[('bggRatings', 'No rated items.')])
+registerInsight('highestAvgRating', genInsightHighestAvgRating, ['averageRating.max'],
+                prechecks=[('avgRatings', 'No rated items.')])
+registerInsight('lowestAvgRating', genInsightLowestAvgRating, ['averageRating.min'],
+                prechecks=[('avgRatings', 'No rated items.')])
+registerInsight('avgAvgRating', genInsightAvgAvgRating, ['averageRating', 'items'],
+                prechecks=[('avgRatings', 'No rated items.')])
+registerInsight('avgRatingDiff', genInsightAvgRatingDiff, RATING_DIFF_INPUTS, prechecks=RATED_PRECHECKS)
+registerInsight('largestRatingDiff', genInsightLargestRatingDiff, RATING_DIFF_INPUTS, prechecks=RATED_PRECHECKS)
+registerInsight('largestPosRatingDiff', genInsightLargestPosRatingDiff, RATING_DIFF_INPUTS, prechecks=RATED_PRECHECKS)
+registerInsight('largestNegRatingDiff', genInsightLargestNegRatingDiff, RATING_DIFF_INPUTS, prechecks=RATED_PRECHECKS)
+registerInsight('ratingAvgRatingCorr', genInsightRatingAvgRatingCorr, ['userRating', 'averageRating'],
+                prechecks=RATED_PRECHECKS, minItems=MIN_CORR_ITEMS, itemFields=['userRating', 'averageRating'],
+                cost=CORRELATION_COST)
+registerInsight('ratingWeightCorr', genInsightRatingWeightCorr, ['userRating', 'averageWeight'],
+                prechecks=RATED_PRECHECKS, minItems=MIN_CORR_ITEMS, itemFields=['userRating', 'averageWeight'],
+                cost=CORRELATION_COST)
+registerInsight('ratingRecommendedPlayersCorr', genInsightRatingRecommendedPlayersCorr,
+                ['userRating', 'recommendedPlayers'], prechecks=RATED_PRECHECKS, minItems=MIN_CORR_ITEMS,
+                itemFields=['userRating'], cost=CORRELATION_COST)
+registerInsight('ratingPlayTimeCorr', genInsightRatingPlayTimeCorr, ['userRating', 'playTime'],
+                prechecks=RATED_PRECHECKS, minItems=MIN_CORR_ITEMS, itemFields=['userRating'], cost=CORRELATION_COST)
+registerInsight('ratingMaxPlayersCorr', genInsightRatingMaxPlayersCorr, ['userRating', 'maxPlayers'],
+                prechecks=RATED_PRECHECKS, minItems=MIN_CORR_ITEMS, itemFields=['userRating'], cost=CORRELATION_COST)
+registerInsight('ratingPlaysCorr', genInsightRatingPlaysCorr, ['userRating', 'numPlays'],
+                prechecks=PLAYED_RATED_PRECHECKS, minItems=MIN_CORR_ITEMS, itemFields=['userRating'],
+                nonZeroFields=['numPlays'], cost=CORRELATION_COST)
+registerInsight('ratingTimePlayedCorr', genInsightRatingTimePlayedCorr, ['userRating', 'numPlays', 'playTime'],
+                prechecks=PLAYED_RATED_PRECHECKS, minItems=MIN_CORR_ITEMS, itemFields=['userRating'],
+                nonZeroFields=['numPlays', 'playTime'], cost=CORRELATION_COST)
+registerInsight('ratingPriceCorr', genInsightRatingPriceCorr, ['userRating', 'medianPrice'], prechecks=RATED_PRECHECKS,
+                minItems=MIN_CORR_ITEMS, itemFields=['userRating', 'medianPrice'], cost=CORRELATION_COST)
+registerInsight('ratingYearCorr', genInsightRatingYearCorr, ['userRating', 'yearPublished'], prechecks=RATED_PRECHECKS,
+                minItems=MIN_CORR_ITEMS, itemFields=['userRating', 'yearPublished'], cost=CORRELATION_COST)
+registerInsight('playsWeightCorr', genInsightPlaysWeightCorr, ['numPlays', 'averageWeight'], prechecks=PLAYED_PRECHECKS,
+                minItems=MIN_CORR_ITEMS, itemFields=['averageWeight'], nonZeroFields=['numPlays'],
+                cost=CORRELATION_COST)
+registerInsight('playsPlayTimeCorr', genInsightPlaysPlayTimeCorr, ['numPlays', 'playTime'],
+                prechecks=[('recordedPlays', 'No rated items.')], minItems=MIN_CORR_ITEMS, nonZeroFields=['numPlays'],
+                cost=CORRELATION_COST)
+registerInsight('playsRecommendedPlayersCorr', genInsightPlaysRecommendedPlayersCorr,
+                ['numPlays', 'recommendedPlayers'], prechecks=[('recordedPlays', 'No rated items.')],
+                minItems=MIN_CORR_ITEMS, nonZeroFields=['numPlays'], cost=CORRELATION_COST)
+registerInsight('playsMaxPlayersCorr', genInsightPlaysMaxPlayersCorr, ['numPlays', 'maxPlayers'],
+                prechecks=[('recordedPlays', 'No rated items.')], minItems=MIN_CORR_ITEMS, nonZeroFields=['numPlays'],
+                cost=CORRELATION_COST)
+registerInsight('playsPriceCorr', genInsightPlaysPriceCorr, ['numPlays', 'medianPrice'],
+                prechecks=[('recordedPlays', 'No rated items.')], minItems=MIN_CORR_ITEMS, itemFields=['medianPrice'],
+                nonZeroFields=['numPlays'], cost=CORRELATION_COST)
+registerInsight('avgYear', genInsightAvgYear, ['yearPublished', 'items'],
+                prechecks=[('years', 'No items with publication year.')])
+registerInsight('mostCommonYears', genInsightMostCommonYears, ['yearPublished', 'items'],
+                prechecks=[('years', 'No items with publication year.')])
+registerInsight('avgRecommendedPlayers', genInsightAvgRecommendedPlayers, ['recommendedPlayers', 'items'],
+                prechecks=[('recommendedPlayers', 'No items with recommended players registered.')])
+registerInsight('avgMaxPlayers', genInsightAvgMaxPlayers, ['maxPlayers', 'items'],
+                prechecks=[('maxPlayers', 'No items with max players registered.')])
+registerInsight('medianMaxPlayers', genInsightMedianMaxPlayers, ['maxPlayers', 'items'],
+                prechecks=[('maxPlayers', 'No items with max players registered.')])
+registerInsight('avgMinPlayers', genInsightAvgMinPlayers, ['minPlayers', 'items'],
+                prechecks=[('minPlayers', 'No items with min players registered.')])
+registerInsight('avgPrice', genInsightAvgPrice, ['medianPrice'],
+                prechecks=[('prices', 'No items with price registered.')])
+registerInsight('medianPrice', genInsightMedianPrice, ['medianPrice'],
+                prechecks=[('prices', 'No items with price registered.')])
+registerInsight('totalPrice', genInsightTotalPrice, ['medianPrice'],
+                prechecks=[('prices', 'No items with price registered.')])
+registerInsight('top100', genInsightTop100, ['subtypeRatings'], prechecks=[('ranks', 'No items with rank registered.')])
+registerInsight('kickstarter', genInsightKickstarter, ['families', 'items'], cost=TAXONOMY_COST)
+registerInsight('mostCommonCategory', genInsightMostCommonCategory, ['categories', 'items'], cost=TAXONOMY_COST)
+registerInsight('mostCommonMechanic', genInsightMostCommonMechanic, ['mechanics', 'items'], cost=TAXONOMY_COST)
+registerInsight('mostCommonFamily', genInsightMostCommonFamily, ['families', 'items'], cost=TAXONOMY_COST)
+registerInsight('mostCommonPublisher', genInsightMostCommonPublisher, ['publishers', 'items'], cost=TAXONOMY_COST)
+registerInsight('mostCommonDesigner', genInsightMostCommonDesigner, ['designers', 'items'], cost=TAXONOMY_COST)
+registerInsight('mostCommonArtist', genInsightMostCommonArtist, ['artists', 'items'], cost=TAXONOMY_COST)
@@ -0,0 +1,165 @@
+from statistics import StatisticsError
+import numpy as np
+from ..utils import getExtremeIndexes
+
+
+class Column:
+    def __init__(self, values, mask, floats=None):
+        self.values = values
+        self.mask = mask
+        self.floats = floats
+
+        # Running Aggregates, Built on First Use and Kept Up to Date by the In-Place Edits
+        self.totals = None
+        self.extremes = {}
+
+    @classmethod
+    def fromEntries(cls, entries):
+        mask = np.array([x is not None for x in entries], dtype=bool)
+
+        # Keep Integer Fields as Integers (JSON Output Depends on It)
+        floats = np.array([x is not None and not isinstance(x, int)
+                           for x in entries], dtype=bool)
+        dtype = np.float64 if floats.any() else np.int64
+
+        values = np.array([0 if x is None else x for x in entries], dtype=dtype)
+        return cls(values, mask, floats)
+
+    # In-Place Edits (Entry Columns Only), Same Dtype Rule as fromEntries
+    def setEntry(self, index, entry):
+        self.dropAggregates(index)
+        self.floats[index] = entry is not None and not isinstance(entry, int)
+        self.fixDtype()
+        self.values[index] = 0 if entry is None else entry
+        self.mask[index] = entry is not None
+        self.addAggregates(index)
+
+    def append(self, entry):
+        self.values = np.append(self.values, 0)
+        self.mask = np.append(self.mask, False)
+        self.floats = np.append(self.floats, False)
+        self.setEntry(len(self.values) - 1, entry)
+
+    def remove(self, index):
+        self.dropAggregates(index)
+        self.values = np.delete(self.values, index)
+        self.mask = np.delete(self.mask, index)
+        self.floats = np.delete(self.floats, index)
+        for extreme in self.extremes.values():
+            if extreme is not None:
+                extreme[1] = {i - 1 if i > index else i for i in extreme[1]}
+        self.fixDtype()
+
+    # A Dtype Change Alters How Sums Round, so the Aggregates Start Over
+    def fixDtype(self):
+        dtype = np.float64 if self.floats.any() else np.int64
+        if self.values.dtype != dtype:
+            self.values = self.values.astype(dtype)
+            self.totals = None
+            self.extremes = {}
+
+    def dropAggregates(self, index):
+        if not self.mask[index]:
+            return
+        value = self.values[index].item()
+        self.updateTotals(-1, value)
+
+        # Losing the Last Extreme Entry Means a Rescan on Next Use
+        for largest, extreme in self.extremes.items():
+            if extreme is not None and index in extreme[1]:
+                extreme[1].discard(index)
+                if extreme[1] == set():
+                    self.extremes[largest] = None
+
+    def addAggregates(self, index):
+        if not self.mask[index]:
+            return
+        value = self.values[index].item()
+        self.updateTotals(1, value)
+        for largest, extreme in self.extremes.items():
+            if extreme is None:
+                continue
+            if extreme[0] is None or (value > extreme[0] if largest else value < extreme[0]):
+                self.extremes[largest] = [value, {index}]
+            elif value == extreme[0]:
+                extreme[1].add(index)
+
+    # Only Integer Sums Run: a Running Float Sum Rounds Differently From a Fresh One and Can Flip a Rounded Mean
+    def updateTotals(self, sign, value):
+        if self.totals is not None:
+            count, total = self.totals
+            self.totals = [count + sign, None if total is None else total + sign * value]
+
+    # Count and Sum of the Entries
+    def getTotals(self):
+        if self.totals is None:
+            values = self.notNone()
+            self.totals = [len(values), values.sum().item() if values.dtype.kind == 'i' else None]
+        count, total = self.totals
+        if total is None:
+            total = self.notNone().sum().item()
+        return count, total
+
+    # [Value, Indexes] of the Largest (or Smallest) Entry, Ties Included
+    def getExtreme(self, largest=True):
+        if self.extremes.get(largest) is None:
+            values = self.notNone()
+            if len(values) == 0:
+                self.extremes[largest] = [None, set()]
+            else:
+                extreme = values.max() if largest else values.min()
+                self.extremes[largest] = [extreme.item(), set(self.notNoneIndexes()[values == extreme].tolist())]
+        return self.extremes[largest]
+
+    def __len__(self):
+        return len(self.values)
+
+    def filter(self, mask):
+        return Column(self.values, self.mask & mask)
+
+    def notNone(self):
+        return self.values[self.mask]
+
+    def notNoneIndexes(self):
+        return np.flatnonzero(self.mask)
+
+    def any(self):
+        return bool(self.mask.any())
+
+    def first(self):
+        if len(self.values) == 0 or not self.mask[0]:
+            return None
+        return self.values[0].item()
+
+    # First of the Tied Extremes
+    def argMax(self):
+        return min(self.getExtreme(True)[1])
+
+    def argMin(self):
+        return min(self.getExtreme(False)[1])
+
+    def extremeIndexes(self, largest=True, k=None):
+        if k is None:
+            return np.array(sorted(self.getExtreme(largest)[1]), dtype=int)
+        return self.notNoneIndexes()[getExtremeIndexes(self.notNone(), largest, k)]
+
+    # Same Result Types as statistics.mean/median (Integers Stay Integers)
+    def mean(self):
+        count, total = self.getTotals()
+        if count == 0:
+            raise StatisticsError('mean requires at least one data point')
+        if self.values.dtype.kind == 'i':
+            return total // count if total % count == 0 else total / count
+        return total / count
+
+    def median(self):
+        values = np.sort(self.notNone())
+        n = len(values)
+        if n == 0:
+            raise StatisticsError('no median for empty data')
+        if n % 2 == 1:
+            return values[n // 2].item()
+        return (values[n // 2 - 1].item() + values[n // 2].item()) / 2
+
+    def sum(self):
+        return self.getTotals()[1]
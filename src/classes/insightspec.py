@@ -0,0 +1,21 @@
+from .insight import Insight
+
+
+class InsightSpec:
+    def __init__(self, type, build, inputs, prechecks=None, minItems=0, itemFields=None, nonZeroFields=None, cost=1,
+                 errorMessages=False):
+        self.type = type
+        self.build = build
+        self.inputs = inputs
+        self.prechecks = prechecks or []
+        self.minItems = minItems
+        self.itemFields = tuple(itemFields or [])
+        self.nonZeroFields = tuple(nonZeroFields or [])
+        self.cost = cost
+        self.errorMessages = errorMessages
+
+    # Plays Insights Report Failures in errorMessage Data, the Rest in the Status
+    def fail(self, message):
+        if self.errorMessages:
+            return Insight(self.type, {'errorMessage': message}, 'error')
+        return Insight(self.type, {}, message)
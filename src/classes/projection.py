@@ -0,0 +1,27 @@
+class Projection:
+    def __init__(self, fields=None, exclude=None):
+        self.fields = None if fields is None else set(fields)
+        self.exclude = set() if exclude is None else set(exclude)
+
+    @classmethod
+    def fromArgs(cls, fields=None, exclude=None):
+        return cls(None if fields is None else splitFieldNames(fields),
+                   None if exclude is None else splitFieldNames(exclude))
+
+    def includesAll(self):
+        return self.fields is None and self.exclude == set()
+
+    def includes(self, key):
+        return (self.fields is None or key in self.fields) and key not in self.exclude
+
+    def apply(self, data):
+        # Lazy Values Are Only Built for Keys the Client Asked For
+        return {key: value() if callable(value) else value
+                for key, value in data.items() if self.includes(key)}
+
+
+def splitFieldNames(fieldNames):
+    return [name.strip() for name in fieldNames.split(',') if name.strip() != '']
+
+
+ALL_FIELDS = Projection()
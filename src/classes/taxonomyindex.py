@@ -0,0 +1,91 @@
+from collections import Counter
+
+STAT_FIELDS = ['categories', 'mechanics', 'families',
+               'designers', 'publishers', 'artists']
+
+
+class TaxonomyIndex:
+    def __init__(self, items, stats=STAT_FIELDS):
+        self.hists = {}
+        self.entries = {}
+        self.lookups = {}
+        for stat in stats:
+            self.addStat(items, stat)
+
+    def addStat(self, items, stat):
+        hist = Counter()
+        entries = {}
+        for i, item in enumerate(items):
+            for e in item.getAllStatEntries(stat):
+                hist[e] += 1
+
+                # Normalized Entry -> Item Indexes (Ascending, No Repeats)
+                itemIndexes = entries.setdefault(e.lower(), [])
+                if itemIndexes == [] or itemIndexes[-1] != i:
+                    itemIndexes.append(i)
+        self.hists[stat] = hist
+        self.entries[stat] = entries
+
+    def appendItem(self, item, index):
+        for stat in self.hists:
+            for e in item.getAllStatEntries(stat):
+                self.hists[stat][e] += 1
+                itemIndexes = self.entries[stat].setdefault(e.lower(), [])
+                if itemIndexes == [] or itemIndexes[-1] != index:
+                    itemIndexes.append(index)
+        self.lookups = {}
+
+    def removeItem(self, items, item, index):
+        for stat in self.hists:
+            statEntries = item.getAllStatEntries(stat)
+
+            # Histogram Key Order Follows First Occurrence, Rebuilt if the Item May Have Been First for an Entry That Stays
+            if any(self.mayBeFirst(stat, e, index) for e in statEntries):
+                self.addStat(items, stat)
+                continue
+            hist = self.hists[stat]
+            for e in statEntries:
+                hist[e] -= 1
+                if hist[e] == 0:
+                    del hist[e]
+            for e in set(x.lower() for x in statEntries):
+                self.entries[stat][e].remove(index)
+                if self.entries[stat][e] == []:
+                    del self.entries[stat][e]
+            for e, itemIndexes in self.entries[stat].items():
+                self.entries[stat][e] = [
+                    i - 1 if i > index else i for i in itemIndexes]
+        self.lookups = {}
+
+    # Normalized Entries Only Know Where Their First Spelling Occurs, Other Spellings Are Assumed First
+    def mayBeFirst(self, stat, statEntry, index):
+        itemIndexes = self.entries[stat][statEntry.lower()]
+        if len(itemIndexes) == 1:
+            return False
+        if itemIndexes[0] == index:
+            return True
+        return len([e for e in self.hists[stat] if e.lower() == statEntry.lower()]) > 1
+
+    def rebuildStat(self, items, stat):
+        self.addStat(items, stat)
+        self.lookups = {}
+
+    def getHist(self, stat):
+        return self.hists[stat]
+
+    def getItemIndexes(self, stat, statEntry, exact=False):
+        statEntry = statEntry.lower()
+        if exact:
+            return self.entries[stat].get(statEntry, [])
+
+        # Substring Match Against Distinct Entries Only
+        lookupKey = (stat, statEntry)
+        if lookupKey not in self.lookups:
+            matches = [itemIndexes for e, itemIndexes in self.entries[stat].items()
+                       if statEntry in e]
+            if len(matches) == 1:
+                self.lookups[lookupKey] = matches[0]
+            else:
+                self.lookups[lookupKey] = sorted(
+                    set(i for itemIndexes in matches for i in itemIndexes))
+        return self.lookups[lookupKey]
@@ -0,0 +1,50 @@
+import os
+
+# Fit Result Cache
+FIT_CACHE_SIZE = int(os.environ.get('FIT_CACHE_SIZE', 512))
+FIT_CACHE_TTL = float(os.environ.get('FIT_CACHE_TTL', 3600))
+
+# Insight Result Cache (InsightsGet)
+INSIGHT_CACHE_SIZE = int(os.environ.get('INSIGHT_CACHE_SIZE', 256))
+INSIGHT_CACHE_TTL = float(os.environ.get('INSIGHT_CACHE_TTL', 600))
+
+# Per-Insight Results Keyed by Input Column Fingerprints, Shared Across Requests
+INSIGHT_RESULT_CACHE_SIZE = int(os.environ.get('INSIGHT_RESULT_CACHE_SIZE', 8192))
+INSIGHT_RESULT_CACHE_TTL = float(os.environ.get('INSIGHT_RESULT_CACHE_TTL', 600))
+
+# Insight Execution ('serial' or 'thread')
+INSIGHT_EXECUTOR = os.environ.get('INSIGHT_EXECUTOR', 'serial')
+INSIGHT_WORKERS = int(os.environ.get('INSIGHT_WORKERS', os.cpu_count() or 1))
+
+# Upstream Collection API (Production: https://sn-bgg-server.herokuapp.com)
+UPSTREAM_URL = os.environ.get('UPSTREAM_URL', 'http://localhost:5000')
+UPSTREAM_POOL_CONNECTIONS = int(os.environ.get('UPSTREAM_POOL_CONNECTIONS', 4))
+UPSTREAM_POOL_SIZE = int(os.environ.get('UPSTREAM_POOL_SIZE', 16))
+UPSTREAM_CONNECT_TIMEOUT = float(os.environ.get('UPSTREAM_CONNECT_TIMEOUT', 3.05))
+UPSTREAM_READ_TIMEOUT = float(os.environ.get('UPSTREAM_READ_TIMEOUT', 30))
+UPSTREAM_RETRIES = int(os.environ.get('UPSTREAM_RETRIES', 2))
+UPSTREAM_BACKOFF = float(os.environ.get('UPSTREAM_BACKOFF', 0.3))
+
+# Stale-While-Revalidate for InsightsGet (Serve Last Result, Refresh in Background)
+INSIGHT_SWR = os.environ.get('INSIGHT_SWR', '1') == '1'
+INSIGHT_STALE_TTL = float(os.environ.get('INSIGHT_STALE_TTL', 86400))
+REFRESH_QUEUE_SIZE = int(os.environ.get('REFRESH_QUEUE_SIZE', 64))
+REFRESH_WORKERS = int(os.environ.get('REFRESH_WORKERS', 1))
+
+# Async Insight Jobs (In-Process)
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+JOB_RESULT_TTL = float(os.environ.get('JOB_RESULT_TTL', 600))
+JOB_QUEUE_SIZE = int(os.environ.get('JOB_QUEUE_SIZE', 64))
+JOB_TIMEOUT = float(os.environ.get('JOB_TIMEOUT', 600))
+
+# Insight Deadlines in Seconds (0 = None), Overridable per Request
+INSIGHT_BUDGET = float(os.environ.get('INSIGHT_BUDGET', 0))
+INSIGHT_DEADLINE = float(os.environ.get('INSIGHT_DEADLINE', 0))
+
+# Batch Insights (Process Pool)
+BATCH_WORKERS = int(os.environ.get('BATCH_WORKERS', os.cpu_count() or 1))
+BATCH_MAX_IN_FLIGHT = int(os.environ.get('BATCH_MAX_IN_FLIGHT', 2 * BATCH_WORKERS))
+
+# Stateful Collections Updated by Deltas (In-Process)
+STATE_CACHE_SIZE = int(os.environ.get('STATE_CACHE_SIZE', 256))
+STATE_TTL = float(os.environ.get('STATE_TTL', 86400))
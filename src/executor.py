@@ -0,0 +1,37 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from threading import Lock
+import os
+
+EXECUTOR_TYPES = {'thread': ThreadPoolExecutor,
+                  'process': ProcessPoolExecutor}
+
+# One Pool per (Type, Size) per Worker Process, Created on First Use
+executors = {}
+executorsLock = Lock()
+executorsPid = None
+
+
+def getExecutor(executorType, workers):
+    global executorsPid
+    if executorType not in EXECUTOR_TYPES:
+        raise ValueError('Unknown executor type: {}'.format(executorType))
+    with executorsLock:
+
+        # Pools Inherited Through a Fork Have No Live Workers, Start Over in Each Process
+        if executorsPid != os.getpid():
+            executorsPid = os.getpid()
+            executors.clear()
+        key = (executorType, workers)
+        if key not in executors:
+            executors[key] = EXECUTOR_TYPES[executorType](max_workers=workers)
+        return executors[key]
+
+
+# A Broken Pool Stays Broken, Replace It Unless Another Caller Already Has
+def resetExecutor(executorType, workers, executor):
+    with executorsLock:
+        key = (executorType, workers)
+        if executors.get(key) is executor:
+            del executors[key]
+    executor.shutdown(wait=False)
+    return getExecutor(executorType, workers)
@@ -1,20 +1,56 @@
 ## app.py ########################################
 
-from flask import Flask, request
-from json import loads
+from flask import Flask, Response, request, stream_with_context
 from flask_restful import Resource, Api, reqparse
 import requests
-from classes.collection import Collection
-from utils import getCurveFit, getBestCurveFit
+import hashlib
+import json
+import time
+from threading import Lock
+from batch import iterBatchResults
+from cache import TTLCache
+from classes.collection import Collection, DEADLINE_EXCEEDED, INSIGHT_TYPES, normalizeInsights, orderByCost, \
+    resolveInsightTypes
+from classes.projection import Projection
+from config import INSIGHT_CACHE_SIZE, INSIGHT_CACHE_TTL, INSIGHT_RESULT_CACHE_SIZE, INSIGHT_RESULT_CACHE_TTL, \
+    INSIGHT_SWR, INSIGHT_STALE_TTL, REFRESH_QUEUE_SIZE, \
+    REFRESH_WORKERS, JOB_WORKERS, JOB_RESULT_TTL, JOB_QUEUE_SIZE, JOB_TIMEOUT, INSIGHT_BUDGET, INSIGHT_DEADLINE, \
+    STATE_CACHE_SIZE, STATE_TTL
+from ingest import STREAM_CHUNK_SIZE, iterBatchStream
+from jobs import JobStore
+from metrics import getCounters, incrementCounter
+from refresh import RefreshQueue
+from state import CollectionStore
+from upstream import fetchCollection
+from utils import getCurveFit, getBestCurveFit, DEFAULT_FIT_ENGINE, fitCache
 
 
 ## collection.py ###############################
 
-from statistics import mean, median
-from scipy.stats import pearsonr, spearmanr
+from concurrent.futures import as_completed
 from datetime import datetime
-from copy import copy
+from functools import wraps
+from itertools import chain
+import hashlib
+import time
+import numpy as np
 from .boardgame import Boardgame
+from .column import Column
 from .insight import Insight
-from utils import getBestCurveFit, getHighestCountKeys
-from collections import Counter
+from .insightspec import InsightSpec
+from .projection import ALL_FIELDS
+from .taxonomyindex import STAT_FIELDS, TaxonomyIndex
+from config import INSIGHT_EXECUTOR, INSIGHT_WORKERS
+from executor import getExecutor
+from metrics import incrementCounter
+from ingest import iterCollectionStream, projectItem
+from utils import getBestCurveFit, getExtremeIndexes, getHighestCountKeys, getPearsonCorrs, getSpearmanCorrs
+
+
+## utils.py ####################################
+
+from scipy.stats import t
+import numpy as np
+import hashlib
+from cache import TTLCache
+from config import FIT_CACHE_SIZE, FIT_CACHE_TTL
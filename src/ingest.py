@@ -0,0 +1,205 @@
+from json import JSONDecoder
+import codecs
+import re
+
+# Fields Read by Collection and Its Insights, Everything Else Is Skipped
+COLLECTION_FIELDS = ['totalItems', 'totalPlays', 'lastLoggedPlay']
+ITEM_FIELDS = ['id', 'name', 'image', 'numPlays', 'playTime', 'userRating', 'averageRating', 'bayesAverageRating',
+               'averageWeight', 'medianPrice', 'averagePriceNew', 'yearPublished', 'minPlayers', 'maxPlayers',
+               'recommendedPlayers', 'subtypeRatings', 'categories', 'mechanics', 'families', 'designers',
+               'publishers', 'artists']
+
+# Batch Body: {"collections": [payload, ...]} and/or {"ids": [id, ...]}
+BATCH_FIELDS = ['collections', 'ids']
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+STRUCTURE_CHARS = re.compile(r'[\[\]{}"]')
+STRING_CHARS = re.compile(r'["\\]')
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+VALUE_DELIMITERS = ',]} \t\n\r'
+
+
+class StreamParser:
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.jsonDecoder = JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.exhausted = False
+        self.kept = None
+        self.keptFrom = 0
+
+    def readMore(self):
+        if self.exhausted:
+            raise ValueError('Unexpected end of JSON stream')
+
+        # Drop Consumed Text Before Appending the Next Chunk (Set Aside First While a Value Is Being Kept)
+        if self.kept is not None:
+            self.kept.append(self.buffer[self.keptFrom:self.pos])
+            self.keptFrom = 0
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        try:
+            chunk = next(self.chunks)
+            if isinstance(chunk, bytes):
+                chunk = self.decoder.decode(chunk)
+        except StopIteration:
+            chunk = self.decoder.decode(b'', final=True)
+            self.exhausted = True
+        self.buffer += chunk
+
+    def skipWhitespace(self):
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or self.exhausted:
+                return
+            self.readMore()
+
+    def peek(self):
+        self.skipWhitespace()
+        if self.pos >= len(self.buffer):
+            raise ValueError('Unexpected end of JSON stream')
+        return self.buffer[self.pos]
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(
+                'Expected one of {!r} at {!r}'.format(chars, char))
+        self.pos += 1
+        return char
+
+    def readValue(self):
+        self.skipWhitespace()
+        while True:
+            try:
+                value, end = self.jsonDecoder.raw_decode(
+                    self.buffer, self.pos)
+
+                # A Number Is Complete Only Once a Delimiter Follows It
+                isNumber = isinstance(value, (int, float)) and not isinstance(value, bool)
+                if self.exhausted or (end < len(self.buffer) and (not isNumber or self.buffer[end] in VALUE_DELIMITERS)):
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.exhausted:
+                    raise
+
+                # Retrying the Decode After Every Chunk Is Quadratic, Find the End of the Value and Decode It Once
+                if self.buffer[self.pos] in '[{"':
+                    return self.readSplitValue()
+            self.readMore()
+
+    def readSplitValue(self):
+        self.kept = []
+        self.keptFrom = self.pos
+        try:
+            self.skipValue()
+            text = ''.join(self.kept) + self.buffer[self.keptFrom:self.pos]
+        finally:
+            self.kept = None
+        return self.jsonDecoder.decode(text)
+
+    def skipValue(self):
+        if self.peek() not in '[{"':
+            self.readValue()
+            return
+
+        # Scan to the Matching Close Without Decoding Anything
+        depth = 0
+        while True:
+            match = STRUCTURE_CHARS.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                self.readMore()
+                continue
+            self.pos = match.end()
+            char = match.group()
+            if char == '"':
+                self.skipStringRest()
+            elif char in '[{':
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0:
+                return
+
+    def skipStringRest(self):
+        while True:
+            match = STRING_CHARS.search(self.buffer, self.pos)
+            if match is None or match.end() == len(self.buffer):
+                self.pos = len(self.buffer) if match is None else match.start()
+                self.readMore()
+                continue
+            if match.group() == '\\':
+                self.pos = match.end() + 1
+                continue
+            self.pos = match.end()
+            return
+
+    def iterObject(self, fields=None):
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.readValue()
+            self.expect(':')
+            if fields is None or key in fields:
+                yield key
+            else:
+                self.skipValue()
+            if self.expect(',}') == '}':
+                return
+
+    def iterArray(self):
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self.expect(',]') == ']':
+                return
+
+
+def projectItem(item):
+    return {itemKey: item[itemKey] for itemKey in ITEM_FIELDS if itemKey in item}
+
+
+def iterCollectionStream(chunks):
+    parser = StreamParser(chunks)
+    for key in parser.iterObject(COLLECTION_FIELDS + ['items']):
+        if key == 'items':
+            for _ in parser.iterArray():
+
+                # One Item at a Time, Cut Down to the Fields in Use
+                yield 'items', projectItem(parser.readValue())
+        else:
+            yield key, parser.readValue()
+
+
+# Cut Down to the Fields in Use Item by Item, Never Decoding the Whole Payload at Once
+def readCollection(parser):
+    collection = {}
+    for key in parser.iterObject(COLLECTION_FIELDS + ['items']):
+        if key == 'items' and parser.peek() == '[':
+            collection['items'] = [projectItem(parser.readValue()) for _ in parser.iterArray()]
+        else:
+            collection[key] = parser.readValue()
+    collection.setdefault('items', [])
+    return collection
+
+
+def iterBatchStream(chunks):
+    parser = StreamParser(chunks)
+    for key in parser.iterObject(BATCH_FIELDS):
+        for _ in parser.iterArray():
+
+            # Malformed Payloads Are Passed Through and Fail on Their Own
+            if key == 'collections' and parser.peek() == '{':
+                yield key, readCollection(parser)
+            else:
+                yield key, parser.readValue()
@@ -0,0 +1,91 @@
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+
+class Job:
+    def __init__(self, total):
+        self.id = uuid.uuid4().hex
+        self.status = 'queued'
+        self.done = 0
+        self.total = total
+        self.result = None
+        self.createdAt = time.time()
+        self.finishedAt = None
+
+    def advance(self, insight=None):
+        self.done += 1
+
+    def toDict(self):
+        jobDict = {'jobId': self.id, 'status': self.status,
+                   'progress': {'done': self.done, 'total': self.total}}
+        if self.status in ['done', 'failed']:
+            jobDict['result'] = self.result
+        return jobDict
+
+
+class JobStore:
+    def __init__(self, workers, resultTtl, maxUnfinished, timeout):
+        self.workers = workers
+        self.resultTtl = resultTtl
+        self.maxUnfinished = maxUnfinished
+        self.timeout = timeout
+        self.jobs = {}
+        self.lock = Lock()
+        self.pool = None
+        self.pid = None
+
+    def getPool(self):
+
+        # Pool Threads Do Not Survive a Fork, Create One per Process
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self.pool
+
+    def submit(self, total, run):
+        job = Job(total)
+        with self.lock:
+            self.purgeExpired()
+
+            # Queued and Running Jobs Are Bounded, None Means the Store Is Full
+            if sum(1 for x in self.jobs.values() if x.finishedAt is None) >= self.maxUnfinished:
+                return None
+            self.jobs[job.id] = job
+            self.getPool().submit(self.runJob, job, run)
+        return job
+
+    def runJob(self, job, run):
+
+        # A Job Purged While Still Queued Never Runs
+        with self.lock:
+            if job.id not in self.jobs:
+                return
+            job.status = 'running'
+        try:
+            result, statusCode = run(job)[:2]
+        except Exception:
+            result, statusCode = {'error': 'Job failed.'}, 500
+        job.result = result
+        job.finishedAt = time.time()
+        if statusCode == 200:
+            job.done = job.total
+            job.status = 'done'
+        else:
+            job.status = 'failed'
+
+    def get(self, jobId):
+        with self.lock:
+            self.purgeExpired()
+            return self.jobs.get(jobId)
+
+    # Finished Jobs Are Kept for resultTtl Seconds, Unfinished Ones Are Given Up After timeout Seconds
+    def purgeExpired(self):
+        now = time.time()
+        expired = [jobId for jobId, job in self.jobs.items()
+                   if (job.finishedAt is not None and now - job.finishedAt > self.resultTtl) or
+                   (job.finishedAt is None and now - job.createdAt > self.timeout)]
+        for jobId in expired:
+            del self.jobs[jobId]
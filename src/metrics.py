@@ -0,0 +1,15 @@
+from collections import Counter
+from threading import Lock
+
+counters = Counter()
+countersLock = Lock()
+
+
+def incrementCounter(name, amount=1):
+    with countersLock:
+        counters[name] += amount
+
+
+def getCounters():
+    with countersLock:
+        return dict(counters)
@@ -0,0 +1,60 @@
+import os
+from queue import Full, Queue
+from threading import Lock, Thread
+
+
+class RefreshQueue:
+    def __init__(self, maxSize, workers=1):
+        self.queue = Queue(maxsize=maxSize)
+        self.workers = workers
+        self.pending = set()
+        self.lock = Lock()
+        self.pid = None
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def submit(self, key, refresh):
+        with self.lock:
+
+            # One Queued Refresh per Key, Drop When the Queue Is Full
+            if key in self.pending:
+                return False
+            try:
+                self.queue.put_nowait((key, refresh))
+            except Full:
+                self.dropped += 1
+                return False
+            self.pending.add(key)
+            self.startWorkers()
+        return True
+
+    def startWorkers(self):
+
+        # Worker Threads Do Not Survive a Fork, Start Them per Process
+        if self.pid == os.getpid():
+            return
+        self.pid = os.getpid()
+        for _ in range(self.workers):
+            Thread(target=self.run, daemon=True).start()
+
+    def run(self):
+        while True:
+            key, refresh = self.queue.get()
+            try:
+                refresh()
+                failed = False
+            except Exception:
+                failed = True
+            with self.lock:
+                self.pending.discard(key)
+                if failed:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+            self.queue.task_done()
+
+    def getStats(self):
+        with self.lock:
+            return {'queued': self.queue.qsize(), 'maxSize': self.queue.maxsize, 'pending': len(self.pending),
+                    'completed': self.completed, 'failed': self.failed, 'dropped': self.dropped}
@@ -0,0 +1,43 @@
+from threading import Event, Lock
+
+
+class Flight:
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self.flights = {}
+        self.lock = Lock()
+
+    def do(self, key, fn):
+        with self.lock:
+            flight = self.flights.get(key)
+            isLeader = flight is None
+            if isLeader:
+                flight = self.flights[key] = Flight()
+
+        # Followers Wait for the Leader's Result (or Error)
+        if not isLeader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.done.set()
+        return flight.result
+
+    def inFlight(self):
+        with self.lock:
+            return len(self.flights)
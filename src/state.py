@@ -0,0 +1,29 @@
+from threading import Lock
+from .cache import TTLCache
+
+
+class CollectionState:
+    def __init__(self, collection):
+        self.collection = collection
+        self.lock = Lock()
+        self.version = 0
+
+
+class CollectionStore:
+    def __init__(self, maxSize, ttl):
+        self.states = TTLCache(maxSize, ttl)
+
+    def put(self, id, collection):
+        state = CollectionState(collection)
+        self.states.set(id, state)
+        return state
+
+    def get(self, id):
+        return self.states.get(id)
+
+    # Every Change Restarts the Entry's TTL
+    def touch(self, id, state):
+        self.states.set(id, state)
+
+    def getStats(self):
+        return self.states.getStats()
@@ -0,0 +1,95 @@
+import os
+import hashlib
+from threading import Lock
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .classes.collection import Collection
+from .config import UPSTREAM_URL, UPSTREAM_POOL_CONNECTIONS, UPSTREAM_POOL_SIZE, UPSTREAM_CONNECT_TIMEOUT, \
+    UPSTREAM_READ_TIMEOUT, UPSTREAM_RETRIES, UPSTREAM_BACKOFF
+from .ingest import STREAM_CHUNK_SIZE
+from .singleflight import SingleFlight
+
+RETRY_STATUSES = [502, 503, 504]
+
+# urllib3 1.26 Renamed method_whitelist to allowed_methods (the Pinned 1.25 Only Knows the Old Name)
+RETRY_METHODS_ARG = 'allowed_methods' if hasattr(Retry, 'DEFAULT_ALLOWED_METHODS') else 'method_whitelist'
+
+sessions = {}
+sessionsLock = Lock()
+
+collectionFlights = SingleFlight()
+
+
+class UpstreamCollection:
+    def __init__(self, body, fingerprint):
+        self.body = body
+        self.fingerprint = fingerprint
+        self.collection = None
+        self.lock = Lock()
+
+    # Parsed Once, However Many Requests Share the Fetch
+    def getCollection(self):
+        with self.lock:
+            if self.collection is None:
+                self.collection = Collection.fromStream(self.body)
+                self.body = None
+            return self.collection
+
+
+def createSession():
+    retry = Retry(total=UPSTREAM_RETRIES, connect=UPSTREAM_RETRIES, read=UPSTREAM_RETRIES,
+                  status=UPSTREAM_RETRIES, backoff_factor=UPSTREAM_BACKOFF,
+                  status_forcelist=RETRY_STATUSES, raise_on_status=False, **{RETRY_METHODS_ARG: ['GET']})
+    adapter = HTTPAdapter(pool_connections=UPSTREAM_POOL_CONNECTIONS,
+                          pool_maxsize=UPSTREAM_POOL_SIZE, max_retries=retry)
+    session = Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def getSession():
+
+    # One Pool per Worker Process, Created on First Use (Never Shared Across Forks)
+    pid = os.getpid()
+    with sessionsLock:
+        if pid not in sessions:
+            sessions.clear()
+            sessions[pid] = createSession()
+        return sessions[pid]
+
+
+def getUpstream(path, **kwargs):
+    response = getSession().get('{}{}'.format(UPSTREAM_URL, path),
+                                timeout=(UPSTREAM_CONNECT_TIMEOUT, UPSTREAM_READ_TIMEOUT), **kwargs)
+    response.raise_for_status()
+    return response
+
+
+def getCollectionStream(id):
+    return getUpstream('/collections/{}/enrich?filter=boardgames,plays'.format(id), stream=True)
+
+
+def readFingerprinted(chunks):
+    digest = hashlib.blake2b(digest_size=16)
+    body = []
+    for chunk in chunks:
+        digest.update(chunk)
+        body.append(chunk)
+    return body, digest.hexdigest()
+
+
+def fetchCollectionNow(id):
+
+    # Raw Chunks Are Kept So a Cache Hit Skips Parsing Altogether
+    with getCollectionStream(id) as response:
+        body, fingerprint = readFingerprinted(
+            response.iter_content(STREAM_CHUNK_SIZE))
+    return UpstreamCollection(body, fingerprint)
+
+
+def fetchCollection(id):
+
+    # Concurrent Requests for the Same Id Share One Fetch
+    return collectionFlights.do(id, lambda: fetchCollectionNow(id))
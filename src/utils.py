@@ -25,16 +25,49 @@
 #     return {'xFit': list(xFit), 'yFit': list(yFit), 'dyFit': list(dyFit)}
 
 
-from kapteyn import kmpfit
+from scipy.stats import t
 import numpy as np
+import hashlib
+from .cache import TTLCache
+from .config import FIT_CACHE_SIZE, FIT_CACHE_TTL
 
+# 'numpy' (Closed-Form Least Squares) or 'kmpfit' (Levenberg-Marquardt)
+FIT_ENGINES = ['numpy', 'kmpfit']
+DEFAULT_FIT_ENGINE = 'numpy'
+CONFIDENCE_PROB = 0.95
 
-def getCurveFit(x, y, fitDomainMin=None, fitDomainMax=None, polyParams=[0, 0, 0, 0, 1]):
+# Pivots Below This Fraction of the Largest Mark Dependent Columns (MINPACK's Default covtol)
+COVARIANCE_TOL = 1e-14
+
+fitCache = TTLCache(FIT_CACHE_SIZE, FIT_CACHE_TTL)
+
+
+def getFitCacheKey(x, y, *params):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(x, dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(y, dtype=float).tobytes())
+    digest.update(repr((len(x),) + params).encode())
+    return digest.hexdigest()
+
+
+def getCachedFit(cacheKey, computeFit):
+    fitObj = fitCache.get(cacheKey)
+    if fitObj is None:
+        fitObj = computeFit()
+        fitCache.set(cacheKey, fitObj)
+
+    # Callers Get Their Own Points to Modify
+    return [dict(point) for point in fitObj]
+
+
+def getFitDomainArrays(x, y, fitDomainMin=None, fitDomainMax=None):
 
     # Sort Arrays
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
     sortIndexes = np.argsort(x)
-    x = [x[i] for i in sortIndexes]
-    y = [y[i] for i in sortIndexes]
+    x = x[sortIndexes]
+    y = y[sortIndexes]
 
     # Get Fit Domain Limits
     if fitDomainMin == None:
@@ -43,76 +76,161 @@ def getCurveFit(x, y, fitDomainMin=None, fitDomainMax=None, polyParams=[0, 0, 0,
         fitDomainMax = max(x)
 
     # Filter X and Y Arrays
-    xFiltered = []
-    yFiltered = []
-    for i in range(len(x)):
-        if x[i] >= float(fitDomainMin) and x[i] <= float(fitDomainMax):
-            xFiltered.append(float(x[i]))
-            yFiltered.append(float(y[i]))
-    xFiltered = np.array(xFiltered)
-    yFiltered = np.array(yFiltered)
-
-    # Fit
-    fit = kmpfit.simplefit(model, [0, 0, 0, 0, 0], xFiltered, yFiltered, parinfo=[{'fixed': polyParams[0]}, {
-                           'fixed': polyParams[1]}, {'fixed': polyParams[2]}, {'fixed': polyParams[3]}, {'fixed': polyParams[4]}])
-    a, b, c, d, e = fit.params
+    inDomain = (x >= float(fitDomainMin)) & (x <= float(fitDomainMax))
+    return x[inDomain], y[inDomain]
+
+
+def getKmpfitFit(x, y, polyParams):
+    from kapteyn import kmpfit
+
+    fit = kmpfit.simplefit(model, [0 for p in polyParams], x, y, parinfo=[
+                           {'fixed': fixed} for fixed in polyParams])
 
     # Get Error Bands
-    dfdp = [0, xFiltered, xFiltered**2, xFiltered**3, xFiltered**4]
+    dfdp = [0] + [x**degree for degree in range(1, len(polyParams))]
     yFit, dyFitUpper, dyFitLower = fit.confidence_band(
-        xFiltered, dfdp, 0.95, model)
+        x, dfdp, CONFIDENCE_PROB, model)
+    return fit.rchi2_min, yFit, dyFitUpper, dyFitLower
+
+
+def getScaledQR(design):
+
+    # QR of the Column-Scaled Design Matrix (Keeps High Powers Well Conditioned)
+    scales = np.linalg.norm(design, axis=0)
+    scales[scales == 0] = 1
+    q, r = np.linalg.qr(design / scales)
+    return q, r, scales
 
-    samplingIndexes = [int(x) for x in np.linspace(0, len(xFiltered)-1, 100)]
-    if isinstance(xFiltered[0], (int, np.int64)):
-        xFiltered = [int(x) for x in xFiltered]
-    if isinstance(yFiltered[0], (int, np.int64)):
-        yFiltered = [int(x) for x in yFiltered]
 
-    xFilteredSample = [xFiltered[i] for i in samplingIndexes]
-    yFilteredSample = [yFit[i] for i in samplingIndexes]
-    dyFitLowerSample = [dyFitLower[i] for i in samplingIndexes]
-    dyFitUpperSample = [dyFitUpper[i] for i in samplingIndexes]
+def isRankDeficient(r):
+    pivots = np.abs(np.diag(r))
+    return bool(np.any(pivots <= COVARIANCE_TOL * pivots.max()))
+
 
-    return [{'x': xFilteredSample[i], 'y': yFilteredSample[i], 'errorLower': dyFitLowerSample[i], 'errorUpper': dyFitUpperSample[i]} for i in range(len(samplingIndexes))]
+# Columns MINPACK Keeps: Its Pivoted QR (qrfac, Downdated Column Norms) Up to the First Pivot Under the Cutoff
+def getIndependentColumns(design):
+    a = np.array(design, dtype=float)
+    n = a.shape[1]
+    pivots = np.arange(n)
+    norms = np.linalg.norm(a, axis=0)
+    lastNorms = norms.copy()
+    rDiag = np.zeros(n)
+    for j in range(min(a.shape)):
+        k = j + int(np.argmax(norms[j:]))
+        a[:, [j, k]] = a[:, [k, j]]
+        pivots[[j, k]] = pivots[[k, j]]
+        norms[k], lastNorms[k] = norms[j], lastNorms[j]
+
+        # Householder Step, Then Downdate the Remaining Norms (Recomputed Once Most Digits Are Lost)
+        columnNorm = np.linalg.norm(a[j:, j])
+        if columnNorm != 0:
+            if a[j, j] < 0:
+                columnNorm = -columnNorm
+            a[j:, j] /= columnNorm
+            a[j, j] += 1
+            for k in range(j + 1, n):
+                a[j:, k] -= (a[j:, j] @ a[j:, k]) / a[j, j] * a[j:, j]
+                if norms[k] != 0:
+                    norms[k] *= np.sqrt(max(0, 1 - (a[j, k] / norms[k]) ** 2))
+                    if 0.05 * (norms[k] / lastNorms[k]) ** 2 <= np.finfo(float).eps:
+                        norms[k] = lastNorms[k] = np.linalg.norm(a[j + 1:, k])
+        rDiag[j] = -columnNorm
 
+    small = np.flatnonzero(np.abs(rDiag) <= COVARIANCE_TOL * abs(rDiag[0]))
+    rank = small[0] if len(small) > 0 else n
+    return np.sort(pivots[:rank])
 
-def getBestDegree(x, y, fitDomainMin=None, fitDomainMax=None, maxDegree=3):
 
-    # Min Chi-Square Array
-    chiSquareArray = []
+def getDesignFit(design, degrees, q, r, scales, y):
+    dof = len(y) - len(degrees)
 
-    # Sort Arrays
-    sortIndexes = np.argsort(x)
-    x = [x[i] for i in sortIndexes]
-    y = [y[i] for i in sortIndexes]
+    # Fewer Distinct x Than Terms: Fit Without the Dependent Columns, as kmpfit Zeroes Their Covariance
+    if isRankDeficient(r):
+        columns = getIndependentColumns(design)
+        design, degrees = design[:, columns], degrees[columns]
+        q, r, scales = getScaledQR(design)
 
-    # Get Fit Domain Limits
-    if fitDomainMin == None:
-        fitDomainMin = min(x)
-    if fitDomainMax == None:
-        fitDomainMax = max(x)
+    yFit = q @ (q.T @ y)
+    rchi2 = np.sum((y - yFit)**2) / dof
 
-    # Filter X and Y Arrays
-    xFiltered = []
-    yFiltered = []
-    for i in range(len(x)):
-        if x[i] >= float(fitDomainMin) and x[i] <= float(fitDomainMax):
-            xFiltered.append(float(x[i]))
-            yFiltered.append(float(y[i]))
-    xFiltered = np.array(xFiltered)
-    yFiltered = np.array(yFiltered)
+    # Confidence Band, Same Derivatives as kmpfit Run (Constant Term Left Out)
+    dfdp = design.copy()
+    dfdp[:, degrees == 0] = 0
+    dfdpCovarRoot = np.linalg.solve(r.T, (dfdp / scales).T)
+    dyFit = t.ppf(1 - (1 - CONFIDENCE_PROB) / 2, dof) * \
+        np.sqrt(rchi2 * np.sum(dfdpCovarRoot**2, axis=0))
+    return rchi2, yFit, yFit + dyFit, yFit - dyFit
+
+
+def getNumpyFit(x, y, polyParams):
+    degrees = np.flatnonzero(np.logical_not(polyParams))
+    design = x[:, np.newaxis] ** degrees
+    q, r, scales = getScaledQR(design)
+    return getDesignFit(design, degrees, q, r, scales, y)
+
+
+def getNumpyDegreeFits(x, y, maxDegree):
+
+    # One Decomposition for All Degrees: the First d+1 Columns of Q and R
+    # Are the QR of the Degree d Design Matrix
+    degrees = np.arange(maxDegree)
+    design = x[:, np.newaxis] ** degrees
+    q, r, scales = getScaledQR(design)
+    return [getDesignFit(design[:, :degree+1], degrees[:degree+1], q[:, :degree+1],
+                         r[:degree+1, :degree+1], scales[:degree+1], y) for degree in range(1, maxDegree)]
 
-    for degree in range(1, maxDegree):
 
-        # Get Polynomial Parameters Array
-        polyParams = getPolyParams(degree)
-        # Fit
-        fit = kmpfit.simplefit(
-            model, [0, 0, 0, 0, 0], xFiltered, yFiltered, parinfo=[{'fixed': polyParams[0]}, {
-                'fixed': polyParams[1]}, {'fixed': polyParams[2]}, {'fixed': polyParams[3]}, {'fixed': polyParams[4]}])
-        chiSquareArray.append(fit.rchi2_min)
+def getPolyFit(x, y, polyParams, engine=DEFAULT_FIT_ENGINE):
+    if engine == 'kmpfit':
+        return getKmpfitFit(x, y, polyParams)
+    if engine == 'numpy':
+        return getNumpyFit(x, y, polyParams)
+    raise ValueError('Unknown fit engine: {}'.format(engine))
 
-    return chiSquareArray.index(max(chiSquareArray)) + 1
+
+def getFitSample(x, fit):
+    rchi2, yFit, dyFitUpper, dyFitLower = fit
+
+    samplingIndexes = np.linspace(0, len(x)-1, 100).astype(int)
+
+    xSample = x[samplingIndexes].tolist()
+    yFitSample = yFit[samplingIndexes].tolist()
+    dyFitLowerSample = dyFitLower[samplingIndexes].tolist()
+    dyFitUpperSample = dyFitUpper[samplingIndexes].tolist()
+
+    return [{'x': xSample[i], 'y': yFitSample[i], 'errorLower': dyFitLowerSample[i], 'errorUpper': dyFitUpperSample[i]} for i in range(len(samplingIndexes))]
+
+
+def getCurveFit(x, y, fitDomainMin=None, fitDomainMax=None, polyParams=[0, 0, 0, 0, 1], engine=DEFAULT_FIT_ENGINE):
+    def computeFit():
+        xFiltered, yFiltered = getFitDomainArrays(
+            x, y, fitDomainMin, fitDomainMax)
+        return getFitSample(xFiltered, getPolyFit(xFiltered, yFiltered, polyParams, engine))
+
+    cacheKey = getFitCacheKey(x, y, 'curve', getFloatOrNone(fitDomainMin), getFloatOrNone(fitDomainMax),
+                              tuple(int(p) for p in polyParams), engine)
+    return getCachedFit(cacheKey, computeFit)
+
+
+def getBestDegreeFit(x, y, maxDegree=3, engine=DEFAULT_FIT_ENGINE):
+    if engine == 'numpy':
+        fits = getNumpyDegreeFits(x, y, maxDegree)
+    else:
+        fits = [getPolyFit(x, y, getPolyParams(degree, maxDegree), engine)
+                for degree in range(1, maxDegree)]
+
+    # Chi-Square Array
+    chiSquareArray = [fit[0] for fit in fits]
+    bestDegreeIndex = chiSquareArray.index(max(chiSquareArray))
+    return bestDegreeIndex + 1, fits[bestDegreeIndex]
+
+
+def getBestDegree(x, y, fitDomainMin=None, fitDomainMax=None, maxDegree=3, engine=DEFAULT_FIT_ENGINE):
+    xFiltered, yFiltered = getFitDomainArrays(
+        x, y, fitDomainMin, fitDomainMax)
+    bestDegree, fit = getBestDegreeFit(
+        xFiltered, yFiltered, maxDegree, engine)
+    return bestDegree
 
 
 def getHighestCountKeys(d):
@@ -125,9 +243,64 @@ def getHighestCountKeys(d):
     return listOfKeys
 
 
+def getExtremeIndexes(values, largest=True, k=None):
+    values = np.asarray(values)
+    if len(values) == 0:
+        return np.array([], dtype=int)
+
+    # All Tied Extremes
+    if k is None:
+        extreme = values.max() if largest else values.min()
+        return np.flatnonzero(values == extreme)
+
+    # Top K (Ties With the K-th Value Are Kept), Best First
+    keys = -values if largest else values
+    kthKey = np.partition(keys, min(k, len(keys)) - 1)[min(k, len(keys)) - 1]
+    selectedIndexes = np.flatnonzero(keys <= kthKey)
+    return selectedIndexes[np.argsort(keys[selectedIndexes], kind='stable')]
+
+
+def getRowRanks(values, masks):
+
+    # Unmasked Entries Sorted by Row, Then Value
+    rows, cols = np.nonzero(masks)
+    rowValues = values[rows, cols]
+    order = np.lexsort((rowValues, rows))
+    rows, cols, rowValues = rows[order], cols[order], rowValues[order]
+
+    # Ties Share the Average of Their Ranks (Same as scipy.stats.rankdata)
+    newRun = np.ones(len(rows), dtype=bool)
+    newRun[1:] = (rows[1:] != rows[:-1]) | (rowValues[1:] != rowValues[:-1])
+    runIds = np.cumsum(newRun) - 1
+    runStarts = np.flatnonzero(newRun)
+    runEnds = np.append(runStarts[1:], len(rows)) - 1
+    rowStarts = np.searchsorted(rows, rows)
+
+    ranks = np.zeros(values.shape)
+    ranks[rows, cols] = (runStarts[runIds] + runEnds[runIds]) / \
+        2 - rowStarts + 1
+    return ranks
+
+
+def getPearsonCorrs(xs, ys, masks):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n = masks.sum(axis=1)
+        dx = (xs - (xs * masks).sum(axis=1, keepdims=True) /
+              n[:, None]) * masks
+        dy = (ys - (ys * masks).sum(axis=1, keepdims=True) /
+              n[:, None]) * masks
+        corrs = (dx * dy).sum(axis=1) / \
+            np.sqrt((dx * dx).sum(axis=1) * (dy * dy).sum(axis=1))
+    corrs[n < 2] = np.nan
+    return np.clip(corrs, -1, 1)
+
+
+def getSpearmanCorrs(xs, ys, masks):
+    return getPearsonCorrs(getRowRanks(xs, masks), getRowRanks(ys, masks), masks)
+
+
 def model(p, x):
-    a, b, c, d, e = p
-    return a + b*x + c*x**2 + d*x**3 + e*x**4
+    return sum(p[degree] * x**degree for degree in range(len(p)))
 
 
 def getPolyParams(degree, maxDegree=3):
@@ -139,8 +312,18 @@ def getPolyParams(degree, maxDegree=3):
     return polyArray
 
 
-def getBestCurveFit(x, y, fitDomainMin=None, fitDomainMax=None, maxDegree=3):
-    bestDegree = getBestDegree(x, y, fitDomainMin, fitDomainMax)
-    fitObj = getCurveFit(x, y, fitDomainMin, fitDomainMax,
-                         getPolyParams(bestDegree))
-    return fitObj
+def getBestCurveFit(x, y, fitDomainMin=None, fitDomainMax=None, maxDegree=3, engine=DEFAULT_FIT_ENGINE):
+    def computeFit():
+        xFiltered, yFiltered = getFitDomainArrays(
+            x, y, fitDomainMin, fitDomainMax)
+        bestDegree, fit = getBestDegreeFit(
+            xFiltered, yFiltered, maxDegree, engine)
+        return getFitSample(xFiltered, fit)
+
+    cacheKey = getFitCacheKey(x, y, 'best', getFloatOrNone(fitDomainMin), getFloatOrNone(fitDomainMax),
+                              int(maxDegree), engine)
+    return getCachedFit(cacheKey, computeFit)
+
+
+def getFloatOrNone(value):
+    return None if value is None else float(value)